@@ -0,0 +1,308 @@
+"""Headless benchmark of every cipher function in cli.py and main.py, and of the cached drawing paths.
+
+    python benchmark.py [--sizes 10,1000,100000,10000000] [--modules cli,main,render]
+                        [--functions vigenere] [--min-time 0.2] [--output results.json]
+    python benchmark.py --check [--tolerance 0.25]      # performance gate, exits 1 on a regression
+    python benchmark.py --update-baseline --rounds 5 --min-time 0.05 --sizes 10,1000,100000
+
+Each function is timed on generated letters-and-spaces text for every key shape
+it accepts. The render module times the gradient, glow and text caches of
+main.py and button.py, both warm and with their cache cleared before every call.
+Throughput comes from the median of repeated runs. A separate traced run records
+the tracemalloc peak and the memory blocks still allocated when the call returns.
+--check re-runs the cases in the stored baseline and exits non-zero when a
+median is slower than the tolerance allows. main.py is imported with SDL's dummy
+drivers, so no window is opened and no sound is played.
+"""
+import argparse
+import functools
+import importlib
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+DEFAULT_SIZES = [10, 1000, 100000, 10000000]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+KEY_SHAPES = {
+    'single_letter': 'k',
+    'numeric': '7',
+    'comma_list': '3, 14, 15, 9, 2, 6',
+    'long_key': 'thequickbrownfoxjumpsoverthelazydog',
+}
+
+# (function name, arguments before the key, whether it returns solution steps)
+FUNCTIONS = [
+    ('additive_encrypt_decrypt', ('e',), False),
+    ('additive_encrypt_decrypt', ('d',), False),
+    ('additive_encrypt_decrypt_with_solution', ('e',), True),
+    ('additive_encrypt_decrypt_with_solution', ('d',), True),
+    ('autokey_encrypt', (), False),
+    ('autokey_decrypt', (), False),
+    ('autokey_encrypt_with_solution', (), True),
+    ('autokey_decrypt_with_solution', (), True),
+    ('vigenere_encrypt', (), False),
+    ('vigenere_decrypt', (), False),
+    ('vigenere_encrypt_with_solution', (), True),
+    ('vigenere_decrypt_with_solution', (), True),
+]
+
+_WORDS = ['the', 'secret', 'message', 'cipher', 'attack', 'at', 'dawn', 'hidden', 'in', 'plain',
+          'sight', 'key', 'letters', 'shift', 'code', 'break', 'world', 'hello', 'game', 'level']
+
+def make_text(size, seed=0):
+    """Letters-and-spaces text of exactly size characters (every cipher here accepts it)"""
+    rng = random.Random(seed)
+    block = ' '.join(rng.choice(_WORDS) for _ in range(12000))
+    return (block * (size // len(block) + 1))[:size]
+
+def load_modules(names):
+    """Import the requested cipher modules (SDL's dummy drivers keep main.py headless)"""
+    return {name: importlib.import_module(name) for name in names}
+
+def accepts(func, args, key):
+    """Whether a function handles a key shape - a probe that raises or returns an error is a skip"""
+    try:
+        out = func('hello world', *args, key)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    result = out[0] if isinstance(out, tuple) else out
+    if isinstance(result, str) and result.startswith('Error'):
+        return result
+    return None
+
+def time_call(call, min_time):
+    """Run a call until min_time has passed (at least 3 runs), returning the run times"""
+    times = []
+    start = time.perf_counter()
+    while len(times) < 3 or (time.perf_counter() - start < min_time and len(times) < 1000):
+        t0 = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - t0)
+    return times
+
+def median_ci(times, z=1.96):
+    """Distribution-free ~95% confidence interval of the median from the order statistics"""
+    ordered = sorted(times)
+    n = len(ordered)
+    half_width = z * n ** 0.5 / 2
+    low = max(0, int(n / 2 - half_width))
+    high = min(n - 1, int(n / 2 + half_width + 0.5))
+    return ordered[low], ordered[high]
+
+def trace_call(call):
+    """tracemalloc peak bytes and the blocks still allocated by one call when it returns"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        out = call()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del out
+    blocks = sum(stat.count for stat in snapshot.statistics('filename')
+                 if not stat.traceback[0].filename.endswith('tracemalloc.py'))
+    return peak, blocks
+
+def _uncached(caches, call):
+    """call with the given caches emptied first, to time the work they save"""
+    def uncached():
+        for cache in caches:
+            cache.clear()
+        return call()
+    return uncached
+
+def render_cases():
+    """(function, key_shape, pixels drawn, call) for the cached drawing paths, warm and cold"""
+    import pygame
+    import button
+    import main
+    screen = main.SCREEN
+    area = screen.get_width() * screen.get_height()
+    rect = pygame.Rect(100, 100, 400, 200)
+    glow_area = (rect.width + main.GLOW_LAYERS * 4) * (rect.height + main.GLOW_LAYERS * 4)
+    font = button.get_font(20)
+    text = "Step-by-Step Solution:"
+    text_area = font.size(text)[0] * font.size(text)[1]
+    frames = itertools.count()
+    gradient = functools.partial(main.draw_gradient_background, screen, (26, 11, 61), (45, 27, 105))
+    animated = lambda: main.draw_animated_background(screen, next(frames))
+    glow = functools.partial(main.draw_glowing_rect, screen, rect, (0, 0, 0, 180), (0, 255, 136), 3)
+    label = functools.partial(button.render_text, font, text, True, "White")
+    return [
+        ('draw_gradient_background', 'cached', area, gradient),
+        ('draw_gradient_background', 'uncached', area, _uncached([main._gradient_cache], gradient)),
+        ('draw_animated_background', 'cached', area, animated),
+        ('draw_animated_background', 'uncached', area,
+         _uncached([main._gradient_cache, main._line_layer_cache], animated)),
+        ('draw_glowing_rect', 'cached', glow_area, glow),
+        ('draw_glowing_rect', 'uncached', glow_area, _uncached([main._glow_sprites, main._glow_slices], glow)),
+        ('render_text', 'cached', text_area, label),
+        ('render_text', 'uncached', text_area, _uncached([button._text_surfaces], label)),
+    ]
+
+def run(sizes=DEFAULT_SIZES, modules=('cli', 'main', 'render'), match=None, min_time=0.2, rounds=1, log=sys.stderr):
+    """Benchmark every function, key shape and size, returning the JSON-ready report.
+
+    With several rounds the whole suite is repeated and each case reports the
+    median of its per-round medians, so slow phases of the machine land in the
+    confidence interval instead of in one unlucky case.
+    """
+    loaded = load_modules([name for name in modules if name != 'render'])
+    texts = {size: make_text(size) for size in sizes}
+    results = []
+    cases = []
+    for module_name, module in loaded.items():
+        for name, args, with_solution in FUNCTIONS:
+            label = f"{name}({', '.join(repr(a) for a in args)})" if args else name
+            if match and match not in label:
+                continue
+            func = getattr(module, name)
+            for shape, key in KEY_SHAPES.items():
+                skip = accepts(func, args, key)
+                if skip:
+                    results.append({'module': module_name, 'function': label, 'with_solution': with_solution,
+                                    'key_shape': shape, 'key': key, 'skipped': skip})
+                    continue
+                for size in sizes:
+                    result = {'module': module_name, 'function': label, 'with_solution': with_solution,
+                              'key_shape': shape, 'key': key, 'size': size}
+                    cases.append((result, functools.partial(func, texts[size], *args, key), []))
+    if 'render' in modules:
+        for name, shape, pixels, call in render_cases():
+            if not match or match in name:
+                cases.append(({'module': 'render', 'function': name, 'key_shape': shape, 'pixels': pixels}, call, []))
+    for _ in range(rounds):
+        for result, call, samples in cases:
+            samples.append(time_call(call, min_time))
+    for result, call, samples in cases:
+        peak, blocks = trace_call(call)
+        if rounds > 1:
+            medians = [statistics.median(times) for times in samples]
+        else:
+            medians = samples[0]
+        median = statistics.median(medians)
+        ci_low, ci_high = median_ci(medians)
+        result.update({
+            'runs': sum(len(times) for times in samples),
+            'rounds': rounds,
+            'median_seconds': median,
+            'ci_low': ci_low,
+            'ci_high': ci_high,
+            'peak_bytes': peak,
+        })
+        if 'size' in result:
+            size = result['size']
+            result.update({
+                'chars_per_second': size / median if median else None,
+                'peak_bytes_per_char': peak / size,
+                'retained_blocks_per_char': blocks / size,
+            })
+            rate = f"{size / median:,.0f} chars/s"
+        else:
+            result.update({'calls_per_second': 1 / median if median else None, 'retained_blocks': blocks})
+            size = f"{result['pixels']:,} px"
+            rate = f"{median * 1e3:.3f} ms/call"
+        results.append(result)
+        if log:
+            print(f"{result['module']}.{result['function']} [{result['key_shape']}] {size}: "
+                  f"{rate}, peak {peak:,} B", file=log)
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'python': platform.python_version(),
+        'numpy': numpy_version,
+        'platform': platform.platform(),
+        'min_time': min_time,
+        'rounds': rounds,
+        'results': results,
+    }
+
+def _case(result):
+    return (result['module'], result['function'], result['key_shape'], result.get('size'))
+
+def compare(baseline, current, tolerance):
+    """Cases whose median got slower than the baseline by more than tolerance (0.25 = 25%).
+
+    A case only counts when the slowdown is also significant - the current
+    median's confidence interval lies entirely above the baseline's - so noisy
+    tiny inputs don't fail the gate. Returns (case, baseline, current) tuples.
+    """
+    previous = {_case(r): r for r in baseline['results'] if 'median_seconds' in r}
+    regressions = []
+    for result in current['results']:
+        old = previous.get(_case(result))
+        if not old or 'median_seconds' not in result:
+            continue
+        if (result['median_seconds'] > old['median_seconds'] * (1 + tolerance)
+                and result['ci_low'] > old['ci_high']):
+            regressions.append((_case(result), old, result))
+    return regressions
+
+def check(baseline_path, tolerance, min_time=None, rounds=None, match=None, log=sys.stderr):
+    """Re-run the suite on the baseline's cases and report regressions; returns the exit code"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    min_time = baseline.get('min_time', 0.2) if min_time is None else min_time
+    rounds = baseline.get('rounds', 1) if rounds is None else rounds
+    sizes = sorted({r['size'] for r in baseline['results'] if 'size' in r})
+    modules = list(dict.fromkeys(r['module'] for r in baseline['results']))
+    current = run(sizes, modules, match, min_time, rounds, log=None)
+    regressions = compare(baseline, current, tolerance)
+    for (module, function, shape, size), old, new in regressions:
+        print(f"REGRESSION {module}.{function} [{shape}] {size}: "
+              f"{old['median_seconds'] * 1e3:.3f} ms (95% CI {old['ci_low'] * 1e3:.3f}-{old['ci_high'] * 1e3:.3f}) -> "
+              f"{new['median_seconds'] * 1e3:.3f} ms (95% CI {new['ci_low'] * 1e3:.3f}-{new['ci_high'] * 1e3:.3f}), "
+              f"{new['median_seconds'] / old['median_seconds'] - 1:+.0%}", file=log)
+    checked = sum(1 for r in current['results'] if 'median_seconds' in r)
+    print(f"{len(regressions)} regression(s) in {checked} cases (tolerance {tolerance:.0%})", file=log)
+    return 1 if regressions else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless benchmark of the cipher functions")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help="comma-separated input sizes in characters")
+    parser.add_argument('--modules', default='cli,main,render',
+                        help="comma-separated modules to benchmark (render: the cached drawing paths)")
+    parser.add_argument('--functions', default=None, help="only benchmark functions whose name contains this")
+    parser.add_argument('--min-time', type=float, default=None,
+                        help="seconds to keep repeating each case (default 0.2, or the baseline's with --check)")
+    parser.add_argument('--rounds', type=int, default=None,
+                        help="repeat the whole suite; medians and confidence intervals come from the rounds "
+                             "(default 1, or the baseline's with --check)")
+    parser.add_argument('--output', default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument('--check', action='store_true',
+                        help="re-run the baseline's cases and fail on regressions (the performance gate)")
+    parser.add_argument('--update-baseline', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON for --check/--update-baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        sys.exit(check(args.baseline, args.tolerance, args.min_time, args.rounds, args.functions))
+    if args.update_baseline:
+        args.output = args.baseline
+    report = run([int(s) for s in args.sizes.split(',')], args.modules.split(','), args.functions,
+                 0.2 if args.min_time is None else args.min_time, args.rounds or 1)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
 import pygame
 import os
+from collections import OrderedDict
 
 class Button():
+    """Retained button: build it once per screen, it re-renders only when its hover state changes"""
     def __init__(self, image, pos, text_input, font, base_color, hovering_color):
         self.image = image
         self.x_pos = pos[0]
@@ -9,8 +11,10 @@ class Button():
         self.font = font
         self.base_color, self.hovering_color = base_color, hovering_color
         self.text_input = text_input
-        self.text = self.font.render(self.text_input, True, self.base_color)
-        if self.image is None:
+        self.hovered = False
+        self.text = render_text(self.font, self.text_input, True, self.base_color)
+        self.own_image = self.image is None
+        if self.own_image:
             self.image = self.text
         self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))
         self.text_rect = self.text.get_rect(center=(self.x_pos, self.y_pos))
@@ -26,20 +30,100 @@ class Button():
         return False
 
     def changeColor(self, position):
-        if position[0] in range(self.rect.left, self.rect.right) and position[1] in range(self.rect.top, self.rect.bottom):
-            self.text = self.font.render(self.text_input, True, self.hovering_color)
-        else:
-            self.text = self.font.render(self.text_input, True, self.base_color)
+        hovered = self.checkForInput(position)
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.render()
 
-def get_font(size):
-    """Get font, fallback to default if custom font not found"""
+    def render(self):
+        self.text = render_text(self.font, self.text_input, True,
+                                self.hovering_color if self.hovered else self.base_color)
+        if self.own_image:
+            self.image = self.text
+            self.rect = self.image.get_rect(center=(self.x_pos, self.y_pos))
+        self.text_rect = self.text.get_rect(center=(self.x_pos, self.y_pos))
+
+class Label():
+    """Retained text line centered on pos, rendered once when it is built"""
+    def __init__(self, pos, text_input, font, color):
+        self.pos = pos
+        self.font = font
+        self.color = color
+        self.text_input = text_input
+        self.render()
+
+    def update(self, screen):
+        screen.blit(self.text, self.text_rect)
+
+    def render(self):
+        self.text = render_text(self.font, self.text_input, True, self.color)
+        self.text_rect = self.text.get_rect(center=self.pos)
+
+FONT_PATH = "assets/font.ttf"
+# Every get_font size the menus use, parsed up front by preload_fonts
+UI_FONT_SIZES = (10, 12, 14, 16, 18, 20, 24, 25, 28, 30, 35, 40, 50, 60)
+
+_fonts = {}
+_font_stats = {'hits': 0, 'misses': 0}
+_font_path = False  # FONT_PATH or None once resolved
+
+def load_font(path, size):
+    """Font for (path, size), parsed once and then reused; path None is pygame's default font"""
+    font = _fonts.get((path, size))
+    if font is not None:
+        _font_stats['hits'] += 1
+        return font
+    _font_stats['misses'] += 1
     try:
-        if os.path.exists("assets/font.ttf"):
-            return pygame.font.Font("assets/font.ttf", size)
-        else:
-            return pygame.font.Font(None, size)
+        font = pygame.font.Font(path, size)
     except:
-        return pygame.font.Font(None, size)
+        font = pygame.font.Font(None, size)
+    _fonts[(path, size)] = font
+    return font
+
+def get_font(size):
+    """Get font, fallback to default if custom font not found"""
+    global _font_path
+    if _font_path is False:
+        _font_path = FONT_PATH if os.path.exists(FONT_PATH) else None
+    return load_font(_font_path, size)
+
+def preload_fonts(sizes=UI_FONT_SIZES):
+    """Parse the UI font sizes before the first frame"""
+    for size in sizes:
+        get_font(size)
+
+def font_cache_info():
+    """Font cache hits, misses and the number of fonts loaded"""
+    return dict(_font_stats, fonts=len(_fonts))
+
+# Rendered text surfaces kept by render_text before the least recently used is dropped
+TEXT_CACHE_SIZE = 512
+
+_text_surfaces = OrderedDict()
+_text_stats = {'hits': 0, 'misses': 0}
+
+def render_text(font, text, antialias, color):
+    """font.render(text, antialias, color), reusing the Surface from an earlier identical call.
+
+    The returned Surface is shared between callers and must not be drawn on.
+    """
+    key = (font, text, antialias, color if isinstance(color, (str, tuple)) else tuple(color))
+    surface = _text_surfaces.get(key)
+    if surface is not None:
+        _text_stats['hits'] += 1
+        _text_surfaces.move_to_end(key)
+        return surface
+    _text_stats['misses'] += 1
+    surface = font.render(text, antialias, color)
+    _text_surfaces[key] = surface
+    if len(_text_surfaces) > TEXT_CACHE_SIZE:
+        _text_surfaces.popitem(last=False)
+    return surface
+
+def text_cache_info():
+    """Text surface cache hits, misses and the number of surfaces held"""
+    return dict(_text_stats, surfaces=len(_text_surfaces))
 
 def load_image(path, fallback_size=(200, 75)):
     """Load image with fallback to colored rectangle"""
@@ -0,0 +1,469 @@
+import functools
+import numbers
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+LETTER_TO_INDEX = dict(zip(LETTERS, range(len(LETTERS))))
+
+# Precomputed shift tables - one per key, built once at import time
+ADDITIVE_TABLES = [str.maketrans(LETTERS, LETTERS[shift:] + LETTERS[:shift]) for shift in range(26)]
+ADDITIVE_BYTE_TABLES = [bytes.maketrans(LETTERS.encode(), (LETTERS[shift:] + LETTERS[:shift]).encode()) for shift in range(26)]
+
+# Byte-level tables for the bytes/memoryview API
+LOWER_BYTES = LETTERS.encode()
+UPPER_BYTES = LETTERS.upper().encode()
+LOWER_TABLE = bytes.maketrans(UPPER_BYTES, LOWER_BYTES)
+UPPER_TABLE = bytes.maketrans(LOWER_BYTES, UPPER_BYTES)
+WRAP_TABLE = bytes((v - 97) % 26 + 97 if v >= 97 else v for v in range(256))  # Letter byte + shift -> a-z
+
+# Optional NumPy backend for the polyalphabetic ciphers
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+if HAVE_NUMPY:
+    LOWER_ARRAY = np.frombuffer(LOWER_TABLE, dtype=np.uint8)
+    WRAP_ARRAY = np.frombuffer(WRAP_TABLE, dtype=np.uint8)
+
+# Key parsing - raw keys are parsed once per cipher and cached
+def _parse_additive(key):
+    """Convert an additive key (letter or number) to its integer shift"""
+    if isinstance(key, str) and len(key) == 1 and key.isalpha():
+        key = LETTERS.find(key.lower())
+        if key == -1:  # Letter not found
+            key = 0
+    else:
+        key = int(key)
+    return key
+
+def _parse_autokey(key):
+    """Convert an autokey seed (number or single letter) to its integer value"""
+    if isinstance(key, str):
+        try:
+            return int(key)
+        except ValueError:
+            return ord(key.upper()) - ord('A')
+    return key
+
+def _parse_vigenere(key):
+    """Return the shift values of a Vigenère key (letters, '0, 5, 8' or a list)"""
+    if isinstance(key, str) and ',' in key:
+        return [int(k.strip()) for k in key.split(',') if k.strip() != '']
+    elif isinstance(key, list):
+        return key
+    return [LETTER_TO_INDEX[k] for k in key.lower() if k in LETTER_TO_INDEX]
+
+class CipherKey:
+    """A raw key as typed by the user, parsed lazily for each cipher.
+
+    Parsed values and derived tables are kept on the object, so reusing the same
+    CipherKey (or the same raw key through get_key) never parses twice. The
+    parsed values are shared - do not modify them.
+    """
+    def __init__(self, raw):
+        self.raw = raw
+        self._parsed = {}
+
+    def _get(self, name, build):
+        if name not in self._parsed:
+            self._parsed[name] = build()
+        return self._parsed[name]
+
+    @property
+    def additive(self):
+        """Shift for the additive cipher"""
+        return self._get('additive', lambda: _parse_additive(self.raw))
+
+    @property
+    def autokey(self):
+        """Seed value for the auto-key cipher"""
+        return self._get('autokey', lambda: _parse_autokey(self.raw))
+
+    @property
+    def vigenere(self):
+        """Shift vector for the Vigenère cipher"""
+        return self._get('vigenere', lambda: _parse_vigenere(self.raw))
+
+    def vigenere_shifts(self, mode):
+        """Vigenère shift vector reduced to 0-25 for encryption ('e') or decryption ('d')"""
+        return self._get('vigenere_' + mode, lambda: [(k if mode == 'e' else -k) % 26 for k in self.vigenere])
+
+    def additive_table(self, mode):
+        """Translation table that encrypts ('e') or decrypts ('d') with the additive shift"""
+        return ADDITIVE_TABLES[(self.additive if mode == 'e' else -self.additive) % 26]
+
+    def additive_byte_table(self, mode):
+        """Byte table that lowercases and shifts ASCII letters in a single translate"""
+        def build():
+            shift = (self.additive if mode == 'e' else -self.additive) % 26
+            shifted = (LETTERS[shift:] + LETTERS[:shift]).encode()
+            return bytes.maketrans(UPPER_BYTES + LOWER_BYTES, shifted + shifted)
+        return self._get('additive_bytes_' + mode, build)
+
+    def __str__(self):
+        return str(self.raw)
+
+    def __repr__(self):
+        return f"CipherKey({self.raw!r})"
+
+@functools.lru_cache(maxsize=1024)
+def _cached_key(raw):
+    return CipherKey(raw)
+
+def get_key(key):
+    """Return the CipherKey for a raw key, reusing parsed keys through an LRU cache"""
+    if isinstance(key, CipherKey):
+        return key
+    if isinstance(key, list):
+        return CipherKey(key)  # Lists are not hashable and are already parsed
+    return _cached_key(key)
+
+def parse_additive_key(key):
+    """Convert an additive key (letter, number or CipherKey) to its integer shift"""
+    return get_key(key).additive
+
+def parse_autokey_key(key):
+    """Convert an autokey seed (number, single letter or CipherKey) to its integer value"""
+    return get_key(key).autokey
+
+def parse_vigenere_key(key):
+    """Return the shift values of a Vigenère key (letters, '0, 5, 8', a list or CipherKey)"""
+    return get_key(key).vigenere
+
+def additive_translate(text, mode, key):
+    """Encrypt ('e') or decrypt ('d') a whole message in one translate call"""
+    key = get_key(key)
+    if isinstance(text, (bytes, bytearray)):
+        return text.lower().translate(ADDITIVE_BYTE_TABLES[(key.additive if mode == 'e' else -key.additive) % 26])
+    return text.lower().translate(key.additive_table(mode))
+
+def text_to_array(text):
+    """Lowercase a message and view it as a uint8 array (UTF-8 bytes never collide with a-z)"""
+    if isinstance(text, str):
+        text = text.lower().encode('utf-8')
+    else:
+        text = bytes(text).lower()
+    return np.frombuffer(text, dtype=np.uint8)
+
+def array_to_text(array):
+    """Convert a uint8 array produced by the NumPy engine back to a string"""
+    return array.tobytes().decode('utf-8')
+
+def letter_indices(text):
+    """Letters of a text as a uint8 array of values 0-25 (everything else dropped)"""
+    array = text_to_array(text)
+    return array[(array >= 97) & (array <= 122)] - 97
+
+def vigenere_batch(messages, keys, mode='e'):
+    """Encrypt ('e') or decrypt ('d') many messages in one vectorized pass.
+
+    keys is either a single key for every message or one key per message.
+    Non-letters pass through unchanged and the key only advances on letters.
+    Returns a list of uint8 arrays, one per message.
+    """
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is required for the batch Vigenère engine")
+    
+    if isinstance(messages, (str, bytes, bytearray)):
+        messages = [messages]
+    arrays = [text_to_array(m) for m in messages]
+    if isinstance(keys, (str, CipherKey)) or (isinstance(keys, list) and all(isinstance(k, numbers.Integral) for k in keys)):
+        keys = [keys] * len(arrays)  # One key shared by every message
+    key_lists = [parse_vigenere_key(k) for k in keys]
+    if len(key_lists) != len(arrays):
+        raise ValueError("Number of keys must match the number of messages")
+    if any(len(k) == 0 for k in key_lists):
+        raise ValueError("Empty or invalid key")
+    if not arrays:
+        return []
+    
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    buf = np.concatenate(arrays)
+    out = buf.copy()
+    mask = (buf >= 97) & (buf <= 122)
+    
+    # Position of each letter inside its own message, counting letters only
+    msg_id = np.repeat(np.arange(len(arrays)), lengths)[mask]
+    letters_per_msg = np.bincount(msg_id, minlength=len(arrays))
+    first_letter = np.concatenate(([0], np.cumsum(letters_per_msg)[:-1]))
+    rank = np.arange(len(msg_id)) - first_letter[msg_id]
+    
+    # Padded key matrix so every message can use its own key
+    key_lengths = np.array([len(k) for k in key_lists], dtype=np.int64)
+    key_matrix = np.zeros((len(key_lists), key_lengths.max() if len(key_lists) else 1), dtype=np.int64)
+    for i, k in enumerate(key_lists):
+        key_matrix[i, :len(k)] = k
+    shifts = key_matrix[msg_id, rank % key_lengths[msg_id]]
+    if mode != 'e':
+        shifts = -shifts
+    
+    out[mask] = (buf[mask].astype(np.int64) - 97 + shifts) % 26 + 97
+    return np.split(out, np.cumsum(lengths)[:-1])
+
+def vigenere_translate(message, key, mode='e'):
+    """Encrypt ('e') or decrypt ('d') a message, using NumPy when available"""
+    try:
+        key_values = parse_vigenere_key(key)
+    except ValueError:
+        return "Error: Invalid numeric key format"
+    if not key_values:
+        return "Error: Empty or invalid key"
+    
+    if HAVE_NUMPY:
+        return array_to_text(vigenere_batch([message], [key_values], mode)[0])
+    
+    # Pure Python fallback
+    sign = 1 if mode == 'e' else -1
+    result = []
+    key_index = 0
+    for letter in message.lower():
+        if letter in LETTER_TO_INDEX:
+            shift = key_values[key_index % len(key_values)]
+            result.append(LETTERS[(LETTER_TO_INDEX[letter] + sign * shift) % 26])
+            key_index += 1
+        else:
+            result.append(letter)
+    return ''.join(result)
+
+def _autokey_prepare(text):
+    """Uppercase and drop spaces, as the auto-key functions always have"""
+    return text.upper().replace(' ', '')
+
+def autokey_encrypt_fast(plaintext, key):
+    """Vectorized autokey_encrypt: ciphertext[i] = p[i] + p[i-1], with the seed at position 0"""
+    key_val = parse_autokey_key(key)
+    plaintext = _autokey_prepare(plaintext)
+    if not (HAVE_NUMPY and plaintext.isascii()):
+        return _autokey_encrypt_loop(plaintext, key_val)
+    
+    data = np.frombuffer(plaintext.encode('ascii'), dtype=np.uint8)
+    values = data.astype(np.int64) - 65
+    alpha = np.flatnonzero((data >= 65) & (data <= 90))
+    # Extended key: the seed followed by the letters of every character but the last
+    extended_key = np.concatenate(([key_val], values[alpha[alpha < len(data) - 1]]))
+    if len(alpha) and alpha[-1] >= len(extended_key):
+        raise IndexError("list index out of range")
+    out = data.copy()
+    out[alpha] = (values[alpha] + extended_key[alpha]) % 26 + 65
+    return out.tobytes().decode('ascii')
+
+def _autokey_encrypt_loop(plaintext, key_val):
+    """Pure Python autokey encryption used for non-ASCII text or without NumPy"""
+    extended_key = [key_val] + [ord(p) - ord('A') for p in plaintext[:-1] if p.isalpha()]
+    ciphertext = []
+    for i, p in enumerate(plaintext):
+        if p.isalpha():
+            ciphertext.append(chr((ord(p) - ord('A') + extended_key[i]) % 26 + ord('A')))
+        else:
+            ciphertext.append(p)
+    return ''.join(ciphertext)
+
+def autokey_encrypt_bytes(data, previous):
+    """Encrypt prepared ASCII bytes where each letter is keyed by the character before it.
+
+    previous is the key value for the first byte; the key value for the byte that
+    would follow is returned with the ciphertext so chunks can be chained.
+    """
+    n = len(data)
+    if n == 0:
+        return b'', previous
+    if not HAVE_NUMPY:
+        out = bytearray(n)
+        for i, c in enumerate(data):
+            out[i] = (c - 65 + previous) % 26 + 65 if 65 <= c <= 90 else c
+            previous = c - 65
+        return bytes(out), previous
+    
+    codes = np.frombuffer(bytes(data), dtype=np.uint8)
+    values = codes.astype(np.int64) - 65
+    keys = np.empty(n, dtype=np.int64)
+    keys[0] = previous
+    keys[1:] = values[:-1]
+    alpha = (codes >= 65) & (codes <= 90)
+    out = codes.copy()
+    out[alpha] = (values[alpha] + keys[alpha]) % 26 + 65
+    return out.tobytes(), int(values[-1])
+
+# Row k maps a ciphertext byte to its plaintext byte when the key value is k
+AUTOKEY_DECRYPT_ROWS = [bytes((c - 65 - k) % 26 + 65 if 65 <= c <= 90 else c for c in range(256)) for k in range(26)]
+AUTOKEY_NEXT_KEY = bytes((c - 65) % 26 for c in range(256))
+
+def autokey_decrypt_bytes(data, previous):
+    """Decrypt prepared ASCII bytes given the key value for the first byte.
+
+    Returns the plaintext bytes and the key value for the byte that would follow,
+    so long inputs can be decrypted chunk by chunk.
+    """
+    n = len(data)
+    if n == 0:
+        return b'', previous
+    if not HAVE_NUMPY:
+        # Run the recurrence over a preallocated buffer
+        out = bytearray(n)
+        rows = AUTOKEY_DECRYPT_ROWS
+        next_key = AUTOKEY_NEXT_KEY
+        k = previous % 26
+        for i, c in enumerate(data):
+            p = rows[k][c]
+            out[i] = p
+            k = next_key[p]
+        return bytes(out), k
+    
+    # p[i] = c[i] - p[i-1] unrolls to an alternating sum of the ciphertext inside each
+    # run of letters, seeded by the key or by the non-letter just before the run
+    codes = np.frombuffer(bytes(data), dtype=np.uint8)
+    values = codes.astype(np.int64) - 65
+    is_alpha = (codes >= 65) & (codes <= 90)
+    sign = 1 - 2 * (np.arange(n) & 1)
+    terms = np.where(is_alpha, sign * values, 0)
+    sums = np.cumsum(terms)
+    
+    starts = is_alpha.copy()
+    starts[1:] &= ~is_alpha[:-1]
+    seeds = np.empty(n, dtype=np.int64)
+    seeds[0] = previous
+    seeds[1:] = values[:-1]
+    base = np.where(starts, sums - terms + sign * seeds, 0)
+    run_start = np.maximum.accumulate(np.where(starts, np.arange(n), 0))
+    
+    out = codes.copy()
+    plain = (sign * (sums - base[run_start])) % 26 + 65
+    out[is_alpha] = plain[is_alpha]
+    return out.tobytes(), int(out[-1]) - 65
+
+def autokey_decrypt_fast(ciphertext, key):
+    """Fast autokey_decrypt for ASCII text, falling back to a loop otherwise"""
+    key_val = parse_autokey_key(key)
+    ciphertext = _autokey_prepare(ciphertext)
+    if not ciphertext.isascii():
+        return _autokey_decrypt_loop(ciphertext, key_val)
+    plaintext, _ = autokey_decrypt_bytes(ciphertext.encode('ascii'), key_val)
+    return plaintext.decode('ascii')
+
+def _autokey_decrypt_loop(ciphertext, key_val):
+    """Pure Python autokey decryption used for non-ASCII text"""
+    plaintext = []
+    for i, c in enumerate(ciphertext):
+        if c.isalpha():
+            k_val = key_val if i == 0 else ord(plaintext[i-1]) - ord('A')
+            plaintext.append(chr((ord(c) - ord('A') - k_val) % 26 + ord('A')))
+        else:
+            plaintext.append(c)
+    return ''.join(plaintext)
+
+# Bytes API - reads any bytes-like input and writes into a caller-supplied buffer, never
+# building a whole output object; additive and autokey copy one TRANSLATE_PIECE at a time
+def _byte_views(src, dst):
+    """Check the buffers and return (src, dst, length)"""
+    src = memoryview(src).cast('B')
+    dst = memoryview(dst).cast('B')
+    if dst.readonly:
+        raise TypeError("Output buffer must be writable")
+    if len(dst) < len(src):
+        raise ValueError("Output buffer is smaller than the input")
+    return src, dst, len(src)
+
+# Bytes translated per step by the *_into functions: the temporary copies that
+# bytes.translate needs stay this small and in cache, whatever the buffer size
+TRANSLATE_PIECE = 1 << 18
+
+def additive_into(src, dst, mode, key):
+    """Additive cipher from a bytes-like src into dst, returning the bytes written.
+
+    ASCII letters are lowercased and shifted exactly like additive_translate;
+    every other byte is copied unchanged. This is not zero-copy: each
+    TRANSLATE_PIECE of src is copied out for bytes.translate and its result
+    copied into dst, which still beats a NumPy lookup straight into dst.
+    """
+    table = get_key(key).additive_byte_table(mode)
+    src, dst, n = _byte_views(src, dst)
+    for start in range(0, n, TRANSLATE_PIECE):
+        end = min(start + TRANSLATE_PIECE, n)
+        dst[start:end] = src[start:end].tobytes().translate(table)
+    return n
+
+def vigenere_into(src, dst, mode, key, key_index=0):
+    """Vigenère cipher from a bytes-like src into dst.
+
+    key_index is the number of letters already processed (the key phase), so a
+    long input can be fed through in pieces. Returns the key index after src.
+    """
+    key = get_key(key)
+    shifts = key.vigenere_shifts(mode)
+    if not shifts:
+        raise ValueError("Empty or invalid key")
+    src, dst, n = _byte_views(src, dst)
+    
+    if not HAVE_NUMPY:
+        # Byte loop fallback when NumPy is not installed
+        for i, c in enumerate(src):
+            c = LOWER_TABLE[c]
+            if 97 <= c <= 122:
+                c = WRAP_TABLE[c + shifts[key_index % len(shifts)]]
+                key_index += 1
+            dst[i] = c
+        return key_index
+    
+    data = np.frombuffer(src, dtype=np.uint8)
+    result = np.frombuffer(dst, dtype=np.uint8)[:n]
+    np.take(LOWER_ARRAY, data, out=result)
+    mask = (result >= 97) & (result <= 122)
+    count = int(np.count_nonzero(mask))
+    # Repeat the key (rotated to the current phase) over the letters only
+    phase = key_index % len(shifts)
+    rotated = np.array(shifts[phase:] + shifts[:phase], dtype=np.uint8)
+    key_stream = np.tile(rotated, count // len(shifts) + 1)[:count]
+    result[mask] = WRAP_ARRAY[result[mask] + key_stream]
+    return key_index + count
+
+def autokey_into(src, dst, mode, key):
+    """Auto-key cipher from a bytes-like src into dst.
+
+    Letters are uppercased and spaces dropped, as in autokey_encrypt/decrypt, so
+    fewer bytes than len(src) may be written. Returns (bytes written, next key):
+    pass the next key back in to continue with the following piece of input.
+    """
+    previous = parse_autokey_key(key)
+    src, dst, n = _byte_views(src, dst)
+    convert = autokey_encrypt_bytes if mode == 'e' else autokey_decrypt_bytes
+    written = 0
+    for start in range(0, n, TRANSLATE_PIECE):
+        data = src[start:min(start + TRANSLATE_PIECE, n)].tobytes().translate(UPPER_TABLE, b' ')
+        out, previous = convert(data, previous)
+        dst[written:written + len(out)] = out
+        written += len(out)
+    return written, previous
+
+class SolutionSteps:
+    """Step-by-step solution that only formats a line when it is displayed.
+
+    header holds the opening lines (strings, or callables for long ones that are
+    formatted on first access) and step(i) explains character i of the input.
+    """
+    def __init__(self, header, count, step):
+        self.header = list(header)
+        self.count = count
+        self.step = step
+
+    def __len__(self):
+        return len(self.header) + self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("solution step index out of range")
+        if index < len(self.header):
+            line = self.header[index]
+            if callable(line):
+                line = self.header[index] = line()
+            return line
+        return self.step(index - len(self.header))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
@@ -0,0 +1,122 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from cipher_engine import LETTERS, additive_into, get_key
+from cipher_stream import DEFAULT_BLOCK_SIZE, VigenereBlocks, same_file
+
+MIN_RANGE_SIZE = 1 << 20  # Smaller ranges are not worth a process hop
+
+_ASCII_LETTERS = (LETTERS + LETTERS.upper()).encode()
+
+def split_ranges(size, parts):
+    """Split [0, size) into at most `parts` contiguous (start, end) ranges"""
+    parts = max(1, min(parts, size // MIN_RANGE_SIZE or 1))
+    step = -(-size // parts)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+def _attach(target, writable=False):
+    """Worker: open a shared memory name or a ('file', path) as a buffer, returning (buffer, close)"""
+    if isinstance(target, tuple):
+        with open(target[1], 'r+b' if writable else 'rb') as f:
+            file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        view = memoryview(file_map)
+        def close():
+            view.release()
+            file_map.close()
+        return view, close
+    shm = shared_memory.SharedMemory(name=target)
+    return shm.buf, shm.close
+
+def _count_letters(target, start, end):
+    """Worker: count the ASCII letters in one range of the input, a block at a time"""
+    buf, close = _attach(target)
+    try:
+        count = 0
+        for block_start in range(start, end, DEFAULT_BLOCK_SIZE):
+            with buf[block_start:min(block_start + DEFAULT_BLOCK_SIZE, end)] as block:
+                count += len(block) - len(bytes(block).translate(None, _ASCII_LETTERS))
+        return count
+    finally:
+        close()
+
+def _transform_range(src_target, dst_target, cipher, mode, key, start, end, key_index):
+    """Worker: transform one range of the input into the output"""
+    src, close_src = _attach(src_target)
+    dst, close_dst = _attach(dst_target, writable=True)
+    try:
+        if cipher == 'vigenere':
+            blocks = VigenereBlocks(mode, key)
+            blocks.key_index = key_index
+        for block_start in range(start, end, DEFAULT_BLOCK_SIZE):
+            block_end = min(block_start + DEFAULT_BLOCK_SIZE, end)
+            with src[block_start:block_end] as block, dst[block_start:block_end] as out:
+                if cipher == 'additive':
+                    additive_into(block, out, mode, key)
+                else:
+                    blocks.process(block, out)
+    finally:
+        close_src()
+        close_dst()
+
+def _run_shared(src, dst, size, cipher, mode, key, workers):
+    """Count letters per range to find each key phase, then transform the ranges in parallel.
+
+    src and dst are shared memory names or ('file', path) tuples the workers map themselves.
+    """
+    ranges = split_ranges(size, workers)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        key_indexes = [0] * len(ranges)
+        if cipher == 'vigenere' and len(ranges) > 1:
+            counts = list(pool.map(_count_letters, [src] * len(ranges),
+                                   [r[0] for r in ranges], [r[1] for r in ranges]))
+            for i in range(1, len(ranges)):
+                key_indexes[i] = key_indexes[i - 1] + counts[i - 1]
+        futures = [pool.submit(_transform_range, src, dst, cipher, mode, key, start, end, key_index)
+                   for (start, end), key_index in zip(ranges, key_indexes)]
+        for future in futures:
+            future.result()
+
+def parallel_translate(data, cipher, mode, key, workers=None):
+    """Encrypt ('e') or decrypt ('d') ASCII bytes with 'additive' or 'vigenere' across processes"""
+    if cipher not in ('additive', 'vigenere'):
+        raise ValueError(f"Parallel mode does not support the {cipher} cipher")
+    if cipher == 'vigenere':
+        VigenereBlocks(mode, key)  # Validate the key before starting any workers
+    else:
+        get_key(key).additive
+    size = len(data)
+    if size == 0:
+        return b''
+
+    src = shared_memory.SharedMemory(create=True, size=size)
+    dst = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        src.buf[:size] = data
+        _run_shared(src.name, dst.name, size, cipher, mode, key, workers or os.cpu_count() or 1)
+        return bytes(dst.buf[:size])
+    finally:
+        for shm in (src, dst):
+            shm.close()
+            shm.unlink()
+
+def parallel_file(cipher, mode, key, input_path, output_path, workers=None):
+    """Transform an ASCII file across processes, returning the number of bytes processed.
+
+    Workers map the input and output files directly, so nothing is held in shared memory.
+    """
+    if cipher not in ('additive', 'vigenere'):
+        raise ValueError(f"Parallel mode does not support the {cipher} cipher")
+    if cipher == 'vigenere':
+        VigenereBlocks(mode, key)
+    else:
+        get_key(key).additive
+    size = os.path.getsize(input_path)
+    if not same_file(input_path, output_path):
+        with open(output_path, 'wb') as f:
+            f.truncate(size)
+    if size == 0:
+        return 0
+
+    _run_shared(('file', input_path), ('file', output_path), size, cipher, mode, key, workers or os.cpu_count() or 1)
+    return size
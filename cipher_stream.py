@@ -0,0 +1,166 @@
+import mmap
+import os
+from cipher_engine import (LETTERS, additive_into, autokey_decrypt_bytes, autokey_encrypt_bytes, get_key,
+                           parse_autokey_key, parse_vigenere_key, vigenere_into, vigenere_translate)
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # Characters read per chunk (1M)
+
+# Deleting every letter tells us how many letters a chunk contained
+_DROP_LETTERS = str.maketrans('', '', LETTERS)
+
+class AdditiveStream:
+    """Additive cipher over a sequence of chunks (the shift is the only state)"""
+    def __init__(self, mode, key):
+        self.table = get_key(key).additive_table(mode)
+
+    def process(self, chunk):
+        return chunk.lower().translate(self.table)
+
+class VigenereStream:
+    """Vigenère cipher over a sequence of chunks, carrying the key index across them"""
+    def __init__(self, mode, key):
+        self.mode = mode
+        self.key_values = parse_vigenere_key(key)
+        if not self.key_values:
+            raise ValueError("Empty or invalid key")
+        self.key_index = 0  # Letters processed so far
+
+    def process(self, chunk):
+        chunk = chunk.lower()
+        phase = self.key_index % len(self.key_values)
+        rotated = self.key_values[phase:] + self.key_values[:phase]
+        self.key_index += len(chunk) - len(chunk.translate(_DROP_LETTERS))
+        return vigenere_translate(chunk, rotated, self.mode)
+
+class AutokeyStream:
+    """Auto-key cipher over a sequence of chunks, carrying the previous plaintext letter.
+
+    Matches autokey_encrypt/autokey_decrypt for text made of letters and spaces.
+    """
+    def __init__(self, mode, key):
+        self.mode = mode
+        self.previous = parse_autokey_key(key)  # Key value for the next character
+
+    def process(self, chunk):
+        chunk = chunk.upper().replace(' ', '')
+        if chunk.isascii():
+            convert = autokey_encrypt_bytes if self.mode == 'e' else autokey_decrypt_bytes
+            out, self.previous = convert(chunk.encode('ascii'), self.previous)
+            return out.decode('ascii')
+        
+        previous = self.previous
+        result = []
+        for c in chunk:
+            if c.isalpha():
+                if self.mode == 'e':
+                    out = chr((ord(c) - ord('A') + previous) % 26 + ord('A'))
+                    previous = ord(c) - ord('A')
+                else:
+                    out = chr((ord(c) - ord('A') - previous) % 26 + ord('A'))
+                    previous = ord(out) - ord('A')
+            else:
+                out = c
+                previous = ord(c) - ord('A')
+            result.append(out)
+        self.previous = previous
+        return ''.join(result)
+
+STREAMS = {
+    'additive': AdditiveStream,
+    'autokey': AutokeyStream,
+    'vigenere': VigenereStream,
+}
+
+def make_stream(cipher, mode, key):
+    """Create a stream for 'additive', 'autokey' or 'vigenere' in mode 'e' or 'd'"""
+    return STREAMS[cipher](mode, key)
+
+def stream_chunks(stream, chunks):
+    """Yield the transformed version of each chunk"""
+    for chunk in chunks:
+        yield stream.process(chunk)
+
+def same_file(input_path, output_path):
+    """Whether output_path names the input file (opening it for writing would truncate the input)"""
+    return output_path is not None and os.path.exists(output_path) and os.path.samefile(input_path, output_path)
+
+def stream_file(stream, input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Transform a text file chunk by chunk with flat memory use, returning characters read"""
+    if same_file(input_path, output_path):
+        raise ValueError("Output file is the input file - use --mmap to transform it in place")
+    total = 0
+    with open(input_path, 'r', encoding='utf-8', newline='') as src, \
+         open(output_path, 'w', encoding='utf-8', newline='') as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(stream.process(chunk))
+            total += len(chunk)
+    return total
+
+# Memory-mapped mode for large ASCII files
+DEFAULT_BLOCK_SIZE = 1 << 24  # Bytes transformed per block (16 MB)
+
+class VigenereBlocks:
+    """Vigenère over raw ASCII blocks, carrying the key index between blocks"""
+    def __init__(self, mode, key):
+        self.mode = mode
+        self.key = get_key(key)
+        if not self.key.vigenere:
+            raise ValueError("Empty or invalid key")
+        self.key_index = 0
+
+    def process(self, block, out):
+        """Transform block (bytes-like) into out (writable buffer of the same length)"""
+        self.key_index = vigenere_into(block, out, self.mode, self.key, self.key_index)
+
+def mmap_file(cipher, mode, key, input_path, output_path=None, block_size=DEFAULT_BLOCK_SIZE):
+    """Transform an ASCII file through memory maps, block by block.
+
+    Only 'additive' and 'vigenere' are supported since they keep the length of
+    the text. With no output_path (or the input's own path) the input file is
+    rewritten in place. Returns the number of bytes processed.
+    """
+    if same_file(input_path, output_path):
+        output_path = None
+    if cipher == 'additive':
+        get_key(key).additive  # Validate the key before touching any file
+        blocks = None
+    elif cipher == 'vigenere':
+        blocks = VigenereBlocks(mode, key)
+    else:
+        raise ValueError(f"Memory-mapped mode does not support the {cipher} cipher")
+    
+    size = os.path.getsize(input_path)
+    if output_path is not None:
+        with open(output_path, 'wb') as f:
+            f.truncate(size)
+    if size == 0:
+        return 0
+    
+    with open(input_path, 'r+b' if output_path is None else 'rb') as src:
+        src_map = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_WRITE if output_path is None else mmap.ACCESS_READ)
+        try:
+            if output_path is None:
+                dst_map = src_map
+            else:
+                dst = open(output_path, 'r+b')
+                dst_map = mmap.mmap(dst.fileno(), 0, access=mmap.ACCESS_WRITE)
+            try:
+                # Blocks are read and written straight through the maps - no intermediate copies
+                with memoryview(src_map) as src_view, memoryview(dst_map) as dst_view:
+                    for start in range(0, size, block_size):
+                        end = min(start + block_size, size)
+                        if blocks is None:
+                            additive_into(src_view[start:end], dst_view[start:end], mode, key)
+                        else:
+                            blocks.process(src_view[start:end], dst_view[start:end])
+                dst_map.flush()
+            finally:
+                if output_path is not None:
+                    dst_map.close()
+                    dst.close()
+        finally:
+            src_map.close()
+    return size
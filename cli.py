@@ -1,10 +1,26 @@
 import sys
 import os
+import re
+import threading
 import json
 from datetime import datetime
+from cipher_engine import (parse_additive_key, parse_autokey_key, parse_vigenere_key, additive_translate,
+                           vigenere_translate, autokey_encrypt_fast, autokey_decrypt_fast, SolutionSteps)
+from cipher_stream import make_stream, stream_file, mmap_file
+from cipher_parallel import parallel_file
+from cryptanalysis import (MAX_KEY_LENGTH, crack_additive, crack_autokey, crack_vigenere, crib_search, crib_search_file,
+                           vigenere_attack, vigenere_known_plaintext)
+from history_analysis import HISTORY_PATH, analyze_history
+from word_index import suggest_keys, word_candidates
 
 # Global list to store cipher history
 cipher_history = []
+interactive = False  # True in the command loop, where 'save' can follow a result
+
+def print_save_hint(what):
+    """Point to the save command, only when one can be typed next"""
+    if interactive:
+        print(f"(Type 'save' to save {what} to history)")
 
 def print_header(title):
     """Print a formatted header"""
@@ -54,69 +70,53 @@ def load_cipher_history():
 # Enhanced Additive Cipher Functions with solution tracking
 def additive_encrypt_decrypt_with_solution(text, mode, key):
     letters = 'abcdefghijklmnopqrstuvwxyz'
-    result = ''
-    solution_steps = []
-    
-    # Convert key to number if it's a letter
-    if isinstance(key, str) and len(key) == 1 and key.isalpha():
-        key = letters.find(key.lower())
-        if key == -1:
-            key = 0
-    else:
-        key = int(key)
-    
-    solution_steps.append(f"Key: {key}")
-    solution_steps.append(f"Mode: {'Encryption' if mode == 'e' else 'Decryption'}")
-    solution_steps.append(f"{'Encryption' if mode == 'e' else 'Decryption'} Process:")
     
+    # Convert key to number if it's a letter, then translate the whole text at once
+    key = parse_additive_key(key)
+    result = additive_translate(text, mode, key)
     actual_key = key if mode == 'e' else -key
     
-    for i, letter in enumerate(text):
-        original_letter = letter
-        letter = letter.lower()
+    def step(i):
+        original_letter = text[i]
+        letter = original_letter.lower()
+        if letter not in letters:
+            return f"{original_letter} (non-alphabetic) -> {original_letter}"
         
-        if letter in letters:
-            index = letters.find(letter)
-            new_index_raw = index + actual_key
-            new_index = new_index_raw % len(letters)
-            new_letter = letters[new_index]
-            result += new_letter
-            
-            # Create step explanation
-            if mode == 'e':
-                if new_index_raw >= 26:
-                    step = f"{original_letter.upper()} ({index}) + {key} = {new_index_raw} = ({new_index_raw}-26) = {new_index} -> {new_letter.upper()}"
-                else:
-                    step = f"{original_letter.upper()} ({index}) + {key} = {new_index} -> {new_letter.upper()}"
-            else:
-                if new_index_raw < 0:
-                    step = f"{original_letter.upper()} ({index}) - {key} = {new_index_raw} = ({new_index_raw}+26) = {new_index} -> {new_letter.upper()}"
-                else:
-                    step = f"{original_letter.upper()} ({index}) - {key} = {new_index} -> {new_letter.upper()}"
-            
-            solution_steps.append(step)
-        else:
-            result += letter
-            solution_steps.append(f"{original_letter} (non-alphabetic) -> {original_letter}")
+        index = letters.find(letter)
+        new_index_raw = index + actual_key
+        new_index = new_index_raw % len(letters)
+        new_letter = letters[new_index]
+        
+        # Create step explanation
+        if mode == 'e':
+            if new_index_raw >= 26:
+                return f"{original_letter.upper()} ({index}) + {key} = {new_index_raw} = ({new_index_raw}-26) = {new_index} -> {new_letter.upper()}"
+            return f"{original_letter.upper()} ({index}) + {key} = {new_index} -> {new_letter.upper()}"
+        if new_index_raw < 0:
+            return f"{original_letter.upper()} ({index}) - {key} = {new_index_raw} = ({new_index_raw}+26) = {new_index} -> {new_letter.upper()}"
+        return f"{original_letter.upper()} ({index}) - {key} = {new_index} -> {new_letter.upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Key: {key}",
+        f"Mode: {'Encryption' if mode == 'e' else 'Decryption'}",
+        f"{'Encryption' if mode == 'e' else 'Decryption'} Process:"
+    ], len(text), step)
     
     return result, solution_steps
 
 def additive_encrypt_decrypt(text, mode, key):
-    result, _ = additive_encrypt_decrypt_with_solution(text, mode, key)
-    return result
+    return additive_translate(text, mode, key)
 
 # Enhanced Auto-Key Cipher Functions with solution tracking
 def generate_autokey(plaintext, key):
     """Generate autokey by prepending the numeric key and using plaintext values"""
-    if isinstance(key, str):
-        try:
-            key_val = int(key)
-        except ValueError:
-            key_val = ord(key.upper()) - ord('A')
-    else:
-        key_val = key
+    # Convert key to numeric if it's a string (parsed keys are cached)
+    key_val = parse_autokey_key(key)
     
+    # Start with the initial key value
     extended_key = [key_val]
+    
+    # Add plaintext character values (excluding the last one)
     plaintext = plaintext.upper().replace(' ', '')
     for i in range(len(plaintext) - 1):
         if plaintext[i].isalpha():
@@ -126,130 +126,117 @@ def generate_autokey(plaintext, key):
 
 def autokey_encrypt_with_solution(plaintext, key):
     plaintext = plaintext.upper().replace(' ', '')
-    extended_key = generate_autokey(plaintext, key)
-    ciphertext = ''
-    solution_steps = []
-    
-    solution_steps.append(f"Original Key: {key}")
-    solution_steps.append(f"Plaintext Values: {[ord(c) - ord('A') for c in plaintext if c.isalpha()]}")
-    solution_steps.append(f"Extended Key: {extended_key}")
-    solution_steps.append("Encryption Process:")
-    
-    for i, p in enumerate(plaintext):
-        if p.isalpha():
-            p_val = ord(p) - ord('A')
-            k_val = extended_key[i]
-            c_val = (p_val + k_val) % 26
-            c = chr(c_val + ord('A'))
-            ciphertext += c
-            
-            step = f"{p} ({p_val}) + {k_val} = {c_val} -> {c}"
-            solution_steps.append(step)
-        else:
-            ciphertext += p
-            solution_steps.append(f"{p} (non-alphabetic) -> {p}")
+    ciphertext = autokey_encrypt_fast(plaintext, key)
+    
+    # The extended key is only needed once a step is displayed
+    extended_key = []
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_autokey(plaintext, key))
+        return extended_key
+    
+    def step(i):
+        p = plaintext[i]
+        if not p.isalpha():
+            return f"{p} (non-alphabetic) -> {p}"
+        p_val = ord(p) - ord('A')
+        k_val = get_extended_key()[i]
+        c_val = (p_val + k_val) % 26
+        return f"{p} ({p_val}) + {k_val} = {c_val} -> {ciphertext[i]}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key}",
+        lambda: f"Plaintext Values: {[ord(c) - ord('A') for c in plaintext if c.isalpha()]}",
+        lambda: f"Extended Key: {get_extended_key()}",
+        "Encryption Process:"
+    ], len(plaintext), step)
     
     return ciphertext, solution_steps
 
 def autokey_decrypt_with_solution(ciphertext, key):
     ciphertext = ciphertext.upper().replace(' ', '')
     
-    if isinstance(key, str):
-        try:
-            key_val = int(key)
-        except ValueError:
-            key_val = ord(key.upper()) - ord('A')
-    else:
-        key_val = key
+    # Convert key to numeric if it's a string (parsed keys are cached)
+    key_val = parse_autokey_key(key)
     
-    plaintext = ''
-    solution_steps = []
+    # First character uses the initial key, the rest use the previous plaintext character
+    plaintext = autokey_decrypt_fast(ciphertext, key_val)
     
-    solution_steps.append(f"Original Key: {key}")
-    solution_steps.append("Decryption Process:")
+    def step(i):
+        c = ciphertext[i]
+        if not c.isalpha():
+            return f"{c} (non-alphabetic) -> {c}"
+        c_val = ord(c) - ord('A')
+        k_val = key_val if i == 0 else ord(plaintext[i-1]) - ord('A')
+        p_val = (c_val - k_val) % 26
+        return f"{c} ({c_val}) - {k_val} = {p_val} -> {plaintext[i]}"
     
-    for i, c in enumerate(ciphertext):
-        if c.isalpha():
-            c_val = ord(c) - ord('A')
-            
-            if i == 0:
-                k_val = key_val
-            else:
-                k_val = ord(plaintext[i-1]) - ord('A')
-            
-            p_val = (c_val - k_val) % 26
-            p = chr(p_val + ord('A'))
-            plaintext += p
-            
-            step = f"{c} ({c_val}) - {k_val} = {p_val} -> {p}"
-            solution_steps.append(step)
-        else:
-            plaintext += c
-            solution_steps.append(f"{c} (non-alphabetic) -> {c}")
+    solution_steps = SolutionSteps([
+        f"Original Key: {key}",
+        "Decryption Process:"
+    ], len(ciphertext), step)
     
     return plaintext, solution_steps
 
 def autokey_encrypt(plaintext, key):
-    result, _ = autokey_encrypt_with_solution(plaintext, key)
-    return result
+    return autokey_encrypt_fast(plaintext, key)
 
 def autokey_decrypt(ciphertext, key):
-    result, _ = autokey_decrypt_with_solution(ciphertext, key)
-    return result
+    return autokey_decrypt_fast(ciphertext, key)
 
 # Enhanced Vigenere Cipher Functions with solution tracking
+def generate_vigenere_key(text, key_values):
+    """Key value under every character of a lowercased text, None for non-letters"""
+    extended_key = []
+    key_index = 0
+    for letter in text:
+        if 'a' <= letter <= 'z':
+            extended_key.append(key_values[key_index % len(key_values)])
+            key_index += 1
+        else:
+            extended_key.append(None)
+    return extended_key
+
 def vigenere_encrypt_with_solution(message, key):
     letters = 'abcdefghijklmnopqrstuvwxyz'
     letter_to_index = dict(zip(letters, range(len(letters))))
     index_to_letter = dict(zip(range(len(letters)), letters))
     
-    encrypted = ''
     message = message.lower()
-    solution_steps = []
     
-    # Parse key
-    if isinstance(key, str) and ',' in key:
-        try:
-            key_values = [int(k.strip()) for k in key.split(',') if k.strip() != '']
-        except ValueError:
-            return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
-    elif isinstance(key, list):
-        key_values = key
-    else:
-        key = key.lower()
-        key_values = [letter_to_index[k] for k in key if k in letters]
+    # Parse key - handle both numeric and letter keys (parsed keys are cached)
+    try:
+        key_values = parse_vigenere_key(key)
+    except ValueError:
+        return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
     
+    # Validate key
     if not key_values or len(key_values) == 0:
         return "Error: Empty or invalid key", ["Error: Please provide a valid key"]
     
+    # The extended key is only needed once a step is displayed
     extended_key = []
-    key_index = 0
-    for letter in message:
-        if letter in letters:
-            extended_key.append(key_values[key_index % len(key_values)])
-            key_index += 1
-        else:
-            extended_key.append(None)
-    
-    solution_steps.append(f"Original Key: {key_values}")
-    solution_steps.append(f"Extended Key: {[k if k is not None else '_' for k in extended_key]}")
-    solution_steps.append("Encryption Process:")
-    
-    key_index = 0
-    for i, letter in enumerate(message):
-        if letter in letters:
-            key_val = key_values[key_index % len(key_values)]
-            letter_val = letter_to_index[letter]
-            encrypted_val = (letter_val + key_val) % len(letters)
-            encrypted_letter = index_to_letter[encrypted_val]
-            encrypted += encrypted_letter
-            
-            step = f"{letter.upper()} ({letter_val}) + {key_val} = {encrypted_val} -> {encrypted_letter.upper()}"
-            solution_steps.append(step)
-            key_index += 1
-        else:
-            encrypted += letter
-            solution_steps.append(f"{letter} (non-alphabetic) -> {letter}")
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_vigenere_key(message, key_values))
+        return extended_key
+    
+    encrypted = vigenere_translate(message, key_values, 'e')
+    
+    def step(i):
+        letter = message[i]
+        key_val = get_extended_key()[i]
+        if key_val is None:
+            return f"{letter} (non-alphabetic) -> {letter}"
+        letter_val = letter_to_index[letter]
+        encrypted_val = (letter_val + key_val) % len(letters)
+        return f"{letter.upper()} ({letter_val}) + {key_val} = {encrypted_val} -> {index_to_letter[encrypted_val].upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key_values}",
+        lambda: f"Extended Key: {[k if k is not None else '_' for k in get_extended_key()]}",
+        "Encryption Process:"
+    ], len(message), step)
     
     return encrypted, solution_steps
 
@@ -258,63 +245,304 @@ def vigenere_decrypt_with_solution(cipher, key):
     letter_to_index = dict(zip(letters, range(len(letters))))
     index_to_letter = dict(zip(range(len(letters)), letters))
     
-    decrypted = ''
     cipher = cipher.lower()
-    solution_steps = []
     
-    # Parse key
-    if isinstance(key, str) and ',' in key:
-        try:
-            key_values = [int(k.strip()) for k in key.split(',') if k.strip() != '']
-        except ValueError:
-            return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
-    elif isinstance(key, list):
-        key_values = key
-    else:
-        key = key.lower()
-        key_values = [letter_to_index[k] for k in key if k in letters]
+    # Parse key - handle both numeric and letter keys (parsed keys are cached)
+    try:
+        key_values = parse_vigenere_key(key)
+    except ValueError:
+        return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
     
+    # Validate key
     if not key_values or len(key_values) == 0:
         return "Error: Empty or invalid key", ["Error: Please provide a valid key"]
     
+    # The extended key is only needed once a step is displayed
     extended_key = []
-    key_index = 0
-    for letter in cipher:
-        if letter in letters:
-            extended_key.append(key_values[key_index % len(key_values)])
-            key_index += 1
-        else:
-            extended_key.append(None)
-    
-    solution_steps.append(f"Original Key: {key_values}")
-    solution_steps.append(f"Extended Key: {[k if k is not None else '_' for k in extended_key]}")
-    solution_steps.append("Decryption Process:")
-    
-    key_index = 0
-    for letter in cipher:
-        if letter in letters:
-            key_val = key_values[key_index % len(key_values)]
-            cipher_val = letter_to_index[letter]
-            decrypted_val = (cipher_val - key_val) % len(letters)
-            decrypted_letter = index_to_letter[decrypted_val]
-            decrypted += decrypted_letter
-            
-            step = f"{letter.upper()} ({cipher_val}) - {key_val} = {decrypted_val} -> {decrypted_letter.upper()}"
-            solution_steps.append(step)
-            key_index += 1
-        else:
-            decrypted += letter
-            solution_steps.append(f"{letter} (non-alphabetic) -> {letter}")
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_vigenere_key(cipher, key_values))
+        return extended_key
+    
+    decrypted = vigenere_translate(cipher, key_values, 'd')
+    
+    def step(i):
+        letter = cipher[i]
+        key_val = get_extended_key()[i]
+        if key_val is None:
+            return f"{letter} (non-alphabetic) -> {letter}"
+        cipher_val = letter_to_index[letter]
+        decrypted_val = (cipher_val - key_val) % len(letters)
+        return f"{letter.upper()} ({cipher_val}) - {key_val} = {decrypted_val} -> {index_to_letter[decrypted_val].upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key_values}",
+        lambda: f"Extended Key: {[k if k is not None else '_' for k in get_extended_key()]}",
+        "Decryption Process:"
+    ], len(cipher), step)
     
     return decrypted, solution_steps
 
 def vigenere_encrypt(message, key):
-    result, _ = vigenere_encrypt_with_solution(message, key)
-    return result
+    return vigenere_translate(message, key, 'e')
 
 def vigenere_decrypt(cipher, key):
-    result, _ = vigenere_decrypt_with_solution(cipher, key)
-    return result
+    return vigenere_translate(cipher, key, 'd')
+
+# Streaming file operations
+def handle_file_command(cipher, operation, rest):
+    """Encrypt/decrypt a file chunk by chunk so memory use stays flat"""
+    # --mmap transforms ASCII files through memory maps (in place if no output is given)
+    use_mmap = '--mmap' in rest
+    rest = rest.replace('--mmap', '')
+    
+    # --workers N splits additive/vigenere files across N processes
+    workers = None
+    workers_match = re.search(r'--workers\s+(\d+)', rest)
+    if workers_match:
+        workers = int(workers_match.group(1))
+        rest = rest[:workers_match.start()] + rest[workers_match.end():]
+    
+    if '--key' not in rest:
+        print("✗ Missing --key parameter")
+        return
+    
+    paths, key = rest.split('--key', 1)
+    paths = paths.split()
+    key = key.strip()
+    if not key or not (len(paths) == 2 or (use_mmap and len(paths) == 1)):
+        print(f"✗ Usage: {cipher} {operation} <input> <output> --key <key> [--mmap] [--workers <n>]")
+        return
+    
+    mode = 'e' if operation == 'encrypt-file' else 'd'
+    output = paths[1] if len(paths) == 2 else paths[0]
+    try:
+        if workers:
+            total = parallel_file(cipher, mode, key, paths[0], output, workers)
+            unit = "bytes"
+        elif use_mmap:
+            total = mmap_file(cipher, mode, key, paths[0], paths[1] if len(paths) == 2 else None)
+            unit = "bytes"
+        else:
+            total = stream_file(make_stream(cipher, mode, key), paths[0], output)
+            unit = "characters"
+        print(f"\n✓ {'Encrypted' if mode == 'e' else 'Decrypted'} {total} {unit} -> {output}")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+
+# Cryptanalysis - recover unknown keys
+def run_vigenere_attack(text, max_len, workers, exhaustive):
+    """Run the parallel key search in the background, showing progress; Ctrl+C cancels it"""
+    cancel = threading.Event()
+    finished = threading.Event()
+    outcome = {}
+    
+    def show_progress(done, total):
+        print(f"\r  Searching keys: {done}/{total} ({100 * done // max(total, 1)}%)", end='', flush=True)
+    
+    def search():
+        try:
+            outcome['results'] = vigenere_attack(text, max_len, workers, exhaustive,
+                                                 progress=show_progress, cancel=cancel)
+        except Exception as e:
+            outcome['error'] = e
+        finally:
+            finished.set()
+    
+    print(f"Searching {'every key' if exhaustive else 'dictionary keys'} up to length {max_len} (Ctrl+C to stop)...")
+    threading.Thread(target=search).start()
+    while not finished.is_set():
+        try:
+            finished.wait(0.2)
+        except KeyboardInterrupt:
+            cancel.set()
+    print()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['results']
+
+def handle_crack_command(cipher, text):
+    """Rank the most likely keys for a ciphertext and show the best decryptions"""
+    global last_result
+    max_len = None
+    match = re.search(r'--max-len\s+(\d+)', text)
+    if match:
+        max_len = int(match.group(1))
+        text = text[:match.start()] + text[match.end():]
+    workers = None
+    match = re.search(r'--workers\s+(\d+)', text)
+    if match:
+        workers = int(match.group(1))
+        text = text[:match.start()] + text[match.end():]
+    exhaustive = '--exhaustive' in text
+    text = text.replace('--exhaustive', '').strip()
+    if not text:
+        print(f"✗ Usage: {cipher} crack <text>")
+        return
+    
+    if cipher == 'additive':
+        results = crack_additive(text)
+        print_header("ADDITIVE CRACK RESULTS")
+        for rank, (key, score, plaintext) in enumerate(results, 1):
+            print(f"{rank}. Key {key:2d} (log-probability {score:9.1f}): {plaintext[:40]}{'...' if len(plaintext) > 40 else ''}")
+        print_divider()
+        key, _, plaintext = results[0]
+        last_result = ('Additive Cipher', 'Monoalphabetic', 'Decryption', text, key, plaintext)
+    elif cipher == 'autokey':
+        results = crack_autokey(text)
+        print_header("AUTO-KEY CRACK RESULTS")
+        for rank, (seed, score, plaintext) in enumerate(results, 1):
+            print(f"{rank}. Seed {seed:2d} ({chr(seed + ord('A'))}) (log-probability {score:9.1f}): {plaintext[:40]}{'...' if len(plaintext) > 40 else ''}")
+        print_divider()
+        key, _, plaintext = results[0]
+        last_result = ('Auto-Key Cipher', 'Polyalphabetic', 'Decryption', text, key, plaintext)
+    elif cipher == 'vigenere':
+        try:
+            if workers or exhaustive:
+                results = run_vigenere_attack(text, max_len or 6, workers, exhaustive)
+            else:
+                results = crack_vigenere(text, max_len or MAX_KEY_LENGTH)
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            return
+        if not results:
+            print("\n✗ Search cancelled before any key was scored")
+            return
+        print_header("VIGENÈRE CRACK RESULTS")
+        for rank, (key, score, plaintext) in enumerate(results, 1):
+            print(f"{rank}. Key {key} (length {len(key)}, log-probability {score:.1f}): {plaintext[:40]}{'...' if len(plaintext) > 40 else ''}")
+        print_divider()
+        key, _, plaintext = results[0]
+        last_result = ('Vigenère Cipher', 'Polyalphabetic', 'Decryption', text, key, plaintext)
+    else:
+        print(f"✗ Cracking is not available for the {cipher} cipher")
+        return
+    
+    print_save_hint("the best result")
+
+def handle_known_command(cipher, rest):
+    """Recover Vigenère keys from a ciphertext and a fragment of its plaintext"""
+    global last_result
+    if cipher != 'vigenere':
+        print(f"✗ Known-plaintext recovery is not available for the {cipher} cipher")
+        return
+    if '--crib' not in rest:
+        print("✗ Usage: vigenere known <text> --crib <plaintext fragment>")
+        return
+    text, crib = rest.split('--crib', 1)
+    text, crib = text.strip(), crib.strip()
+    try:
+        results = vigenere_known_plaintext(text, crib)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return
+    
+    print_header("KNOWN-PLAINTEXT KEY RECOVERY")
+    if not results:
+        print("  No periodic key fits the crib (a key must repeat at least once inside it)")
+        print_divider()
+        return
+    offsets = {}
+    for offset, key in results:
+        offsets.setdefault(key, []).append(offset)
+    for rank, (key, found) in enumerate(offsets.items(), 1):
+        plaintext = vigenere_translate(text, key, 'd')
+        shown = ', '.join(str(offset) for offset in found[:5]) + (' ...' if len(found) > 5 else '')
+        print(f"{rank}. Key {key} (offset {shown}): {plaintext[:40]}{'...' if len(plaintext) > 40 else ''}")
+    print_divider()
+    key = results[0][1]
+    last_result = ('Vigenère Cipher', 'Polyalphabetic', 'Decryption', text, key, vigenere_translate(text, key, 'd'))
+    print_save_hint("the best result")
+
+def handle_analyze_history_command(args):
+    """Crack every saved entry in a worker pool and compare the recovered keys with the stored ones"""
+    workers = None
+    match = re.search(r'--workers\s+(\d+)', args)
+    if match:
+        workers = int(match.group(1))
+        args = args[:match.start()] + args[match.end():]
+    path = args.strip() or HISTORY_PATH
+    if not os.path.exists(path):
+        print(f"✗ History file not found: {path}")
+        return
+    
+    print_header("HISTORY CRYPTANALYSIS")
+    total = matched = 0
+    try:
+        for i, report in enumerate(analyze_history(path, workers), 1):
+            total += 1
+            matched += report['match']
+            if 'error' in report:
+                outcome = f"error: {report['error']}"
+            elif report['detected_type'] == 'unknown':
+                outcome = f"no English reading ✗ (stored: {report['stored_type']} key {report['stored_key']})"
+            else:
+                outcome = (f"{report['detected_type']} key {report['recovered_key']} "
+                           f"{'✓' if report['match'] else '✗'} (stored: {report['stored_type']} key {report['stored_key']})")
+            print(f"[{i}] {report['timestamp']}: {outcome}")
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return
+    print_divider()
+    print(f"Recovered {matched} of {total} stored keys")
+
+def handle_suggest_command(cipher, text):
+    """Show the dictionary words each cipher word could be and the keys they agree on"""
+    global last_result
+    text = text.strip()
+    if not text:
+        print(f"✗ Usage: {cipher} suggest <text>")
+        return
+    if cipher != 'additive':
+        print(f"✗ Word suggestions are not available for the {cipher} cipher")
+        return
+    
+    print_header("ADDITIVE WORD SUGGESTIONS")
+    for cipher_word in dict.fromkeys(re.findall(r'[a-zA-Z]+', text)):
+        candidates = word_candidates(cipher_word)
+        shown = ', '.join(f"{word} (key {key})" for word, key in candidates[:5])
+        more = f" +{len(candidates) - 5} more" if len(candidates) > 5 else ""
+        print(f"  {cipher_word}: {shown + more if candidates else 'no dictionary match'}")
+    
+    results = suggest_keys(text)
+    if not results:
+        print_divider()
+        print("⚠ No key turns these words into dictionary words")
+        return
+    print("\nBest keys:")
+    for rank, (key, matched, plaintext) in enumerate(results, 1):
+        print(f"{rank}. Key {key:2d} ({matched} dictionary words): {plaintext[:40]}{'...' if len(plaintext) > 40 else ''}")
+    print_divider()
+    key, _, plaintext = results[0]
+    last_result = ('Additive Cipher', 'Monoalphabetic', 'Decryption', text, key, plaintext)
+    print_save_hint("the best result")
+
+def handle_crib_command(args):
+    """Search the saved results and any files for cribs under every additive key"""
+    files = re.findall(r'--file\s+(\S+)', args)
+    args = re.sub(r'--file\s+\S+', '', args).strip()
+    cribs = [crib.strip() for crib in args.split(',') if crib.strip()]
+    if not cribs:
+        print("✗ Usage: crib <word>[,<word>...] [--file <path>]...")
+        return
+    
+    print_header("CRIB SEARCH RESULTS")
+    found = 0
+    try:
+        for i, entry in enumerate(cipher_history, 1):
+            for offset, crib, key in crib_search(entry['result'], cribs):
+                print(f"  History [{i}] offset {offset}: '{crib}' with key {key}")
+                found += 1
+        for path in files:
+            for offset, crib, key in crib_search_file(path, cribs):
+                print(f"  {path} offset {offset}: '{crib}' with key {key}")
+                found += 1
+    except (OSError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        return
+    if not found:
+        print("  No matches found")
+    print_divider()
 
 # CLI Command Handler
 def handle_command(command):
@@ -336,6 +564,21 @@ def handle_command(command):
         print("  autokey decrypt <text> --key <key>      - Decrypt using Auto-Key cipher")
         print("  vigenere encrypt <text> --key <key>     - Encrypt using Vigenère cipher")
         print("  vigenere decrypt <text> --key <key>     - Decrypt using Vigenère cipher")
+        print("\nCRYPTANALYSIS:")
+        print("  additive crack <text>                   - Recover an unknown Additive key")
+        print("  additive suggest <text>                 - Suggest dictionary words and keys")
+        print("  autokey crack <text>                    - Recover an unknown Auto-Key seed")
+        print("  vigenere crack <text> [--max-len <n>]   - Recover an unknown Vigenère key (length 1-40)")
+        print("  vigenere crack <text> --max-len <n> --workers <n> [--exhaustive]")
+        print("                                          - Parallel dictionary/exhaustive key search")
+        print("  vigenere known <text> --crib <fragment> - Recover a Vigenère key from known plaintext")
+        print("  crib <word>[,<word>...] [--file <path>] - Find words under any Additive key in history/files")
+        print("  analyze-history [<file>] [--workers <n>] - Crack every history entry and check the stored keys")
+        print("\nLARGE FILES (streamed in chunks):")
+        print("  <cipher> encrypt-file <input> <output> --key <key>")
+        print("  <cipher> decrypt-file <input> <output> --key <key>")
+        print("  additive/vigenere encrypt-file <input> [<output>] --key <key> --mmap")
+        print("  additive/vigenere encrypt-file <input> <output> --key <key> --workers <n>")
         print("\nWITH SOLUTION STEPS:")
         print("  additive encrypt <text> --key <key> --steps")
         print("\nHISTORY:")
@@ -367,6 +610,14 @@ def handle_command(command):
                 print(f"    Result: {entry['result'][:40]}{'...' if len(entry['result']) > 40 else ''}")
             print_divider()
     
+    # Batch cryptanalysis of the saved history
+    elif cmd == 'analyze-history':
+        handle_analyze_history_command(args)
+    
+    # Known-plaintext search
+    elif cmd == 'crib':
+        handle_crib_command(args)
+    
     # Cipher operations
     elif cmd in ['additive', 'autokey', 'vigenere']:
         if not args:
@@ -382,6 +633,26 @@ def handle_command(command):
         operation = parts[0].lower()
         rest = parts[1]
         
+        # Streaming file mode
+        if operation in ['encrypt-file', 'decrypt-file']:
+            handle_file_command(cmd, operation, rest)
+            return
+        
+        # Recover an unknown key
+        if operation == 'crack':
+            handle_crack_command(cmd, rest)
+            return
+        
+        # Known-plaintext key recovery
+        if operation == 'known':
+            handle_known_command(cmd, rest)
+            return
+        
+        # Dictionary word suggestions
+        if operation == 'suggest':
+            handle_suggest_command(cmd, rest)
+            return
+        
         # Check for --steps flag
         show_steps = '--steps' in rest
         rest = rest.replace('--steps', '')
@@ -490,7 +761,7 @@ def handle_command(command):
                     print("✗ Operation must be 'encrypt' or 'decrypt'")
                     return
             
-            print("(Type 'save' to save this result to history)")
+            print_save_hint("this result")
             
         except Exception as e:
             print(f"✗ Error: {e}")
@@ -512,6 +783,13 @@ def handle_command(command):
 # Main program
 def main():
     """Main CLI loop"""
+    global interactive
+    # Run a single command straight from the shell (e.g. for large file jobs)
+    if len(sys.argv) > 1:
+        load_cipher_history()
+        handle_command(' '.join(sys.argv[1:]))
+        return
+    
     print_header("CIPHER WORLD CLI")
     print("Welcome to Cipher World - Command Line Interface")
     print("Type 'help' for available commands")
@@ -521,6 +799,7 @@ def main():
     load_cipher_history()
     
     # Main command loop
+    interactive = True
     while True:
         try:
             command = input("\ncipher> ").strip()
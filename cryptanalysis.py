@@ -0,0 +1,500 @@
+import os
+import signal
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from cipher_engine import (HAVE_NUMPY, LETTER_TO_INDEX, LETTERS, _autokey_prepare, additive_translate,
+                           autokey_decrypt_bytes, autokey_decrypt_fast, letter_indices, np, vigenere_translate)
+from cipher_stream import DEFAULT_CHUNK_SIZE
+from quadgrams import score_letters, table_available
+
+QUADGRAM_SAMPLE = 2000  # Letters scored per candidate - plenty to tell English from noise
+
+# Relative frequency of each letter in English text (a-z)
+ENGLISH_FREQUENCIES = [
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074
+]
+
+def letter_counts(text):
+    """Count each letter a-z in a text (case-insensitive) in 26 C-level passes"""
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode('latin-1')
+    text = text.lower()
+    return [text.count(letter) for letter in LETTERS]
+
+def chi_squared_by_shift(counts):
+    """Chi-squared distance from English for all 26 shifts of one letter histogram.
+
+    Entry k scores decrypting with key k: the plaintext letter j was observed
+    counts[(j + k) % 26] times, so the histogram is rotated instead of the text
+    being decrypted 26 times.
+    """
+    total = sum(counts)
+    if total == 0:
+        return [0.0] * 26
+    expected = [f * total for f in ENGLISH_FREQUENCIES]
+    scores = []
+    for shift in range(26):
+        score = 0.0
+        for j in range(26):
+            diff = counts[(j + shift) % 26] - expected[j]
+            score += diff * diff / expected[j]
+        scores.append(score)
+    return scores
+
+if HAVE_NUMPY:
+    _ROTATIONS = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26  # [shift, j] -> (j + shift) % 26
+
+def _sample_letters(text):
+    """The first QUADGRAM_SAMPLE letters of a text as 0-25 values"""
+    if HAVE_NUMPY:
+        return letter_indices(text)[:QUADGRAM_SAMPLE].astype(np.int64)
+    letters = []
+    for c in text.lower():
+        if c in LETTER_TO_INDEX:
+            letters.append(LETTER_TO_INDEX[c])
+            if len(letters) == QUADGRAM_SAMPLE:
+                break
+    return letters
+
+def rank_additive_keys(ciphertext):
+    """Return all 26 additive keys as (key, log_probability) pairs, best first.
+
+    Without the quadgram table the score is the negated chi-squared distance of
+    the key's decryption from English letter frequencies.
+    """
+    if not table_available():
+        return sorted(enumerate(-score for score in chi_squared_by_shift(letter_counts(ciphertext))),
+                      key=lambda item: -item[1])
+    letters = _sample_letters(ciphertext)
+    if HAVE_NUMPY:
+        scores = score_letters((letters - np.arange(26)[:, None]) % 26).tolist()
+    else:
+        scores = [score_letters([(v - key) % 26 for v in letters]) for key in range(26)]
+    return sorted(enumerate(scores), key=lambda item: -item[1])
+
+def crack_additive(ciphertext, top=5):
+    """Recover the most likely additive keys, returning (key, log_probability, plaintext) tuples"""
+    return [(key, score, additive_translate(ciphertext, 'd', key))
+            for key, score in rank_additive_keys(ciphertext)[:top]]
+
+# Vigenère - key length from column statistics, then one additive solve per column
+MAX_KEY_LENGTH = 40
+ENGLISH_IOC_THRESHOLD = 0.055  # English is about 0.066, random letters 0.038
+MIN_COLUMN_LETTERS = 20  # Columns shorter than this give a noisy IoC
+
+def column_counts(indices, length):
+    """Letter histogram of every column for one key length, as a (length, 26) array.
+
+    The letters are padded to whole rows, reshaped to (rows, length) and counted
+    with a single bincount over column * 27 + letter (27 holds the padding).
+    """
+    rows = -(-len(indices) // length)
+    grid = np.full(rows * length, 26, dtype=np.int64)
+    grid[:len(indices)] = indices
+    grid = grid.reshape(rows, length) + np.arange(length) * 27
+    return np.bincount(grid.ravel(), minlength=length * 27).reshape(length, 27)[:, :26]
+
+def column_ioc(indices, length):
+    """Mean index of coincidence of the columns for one key length"""
+    counts = column_counts(indices, length)
+    totals = counts.sum(axis=1)
+    valid = totals > 1
+    if not valid.any():
+        return 0.0
+    pairs = (counts * (counts - 1)).sum(axis=1)
+    return float((pairs[valid] / (totals[valid] * (totals[valid] - 1))).mean())
+
+def kasiski_distances(indices):
+    """Distances between consecutive repeats of every trigram"""
+    if len(indices) < 3:
+        return np.zeros(0, dtype=np.int64)
+    values = indices.astype(np.int64)
+    trigrams = values[:-2] * 676 + values[1:-1] * 26 + values[2:]
+    order = np.argsort(trigrams, kind='stable')  # Stable, so positions stay ascending per trigram
+    repeats = trigrams[order[1:]] == trigrams[order[:-1]]
+    return (order[1:] - order[:-1])[repeats]
+
+def rank_key_lengths(ciphertext, max_len=MAX_KEY_LENGTH):
+    """Rank Vigenère key lengths 1..max_len, best first, as (length, ioc, kasiski) tuples.
+
+    Lengths whose column IoC looks like English are the true length and its
+    multiples; among those the one dividing the most repeat distances wins (a
+    multiple divides fewer), then the shortest. The remaining lengths follow by IoC.
+    """
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is required for Vigenère cryptanalysis")
+    indices = letter_indices(ciphertext)
+    max_len = max(1, min(max_len, len(indices) // 2))
+    distances = kasiski_distances(indices)
+    stats = [(length, column_ioc(indices, length), int((distances % length == 0).sum()))
+             for length in range(1, max_len + 1)]
+    threshold = min(ENGLISH_IOC_THRESHOLD, max(ioc for _, ioc, _ in stats))
+    english = [s for s in stats if s[1] >= threshold]
+    others = sorted((s for s in stats if s[1] < threshold), key=lambda s: -s[1])
+    
+    # A divisor of the true length can pass the threshold when some of its merged
+    # alphabets agree; the true length then has well-filled columns, a clearly
+    # higher IoC and almost the same repeat distances
+    demoted = {stat: any(length % stat[0] == 0 and length > stat[0] and ioc >= 1.1 * stat[1]
+                         and kasiski >= 0.8 * stat[2] and len(indices) >= MIN_COLUMN_LETTERS * length
+                         for length, ioc, kasiski in english)
+               for stat in english}
+    english.sort(key=lambda s: (demoted[s], -s[2], s[0]))
+    return english + others
+
+def chi_squared_columns(counts):
+    """chi_squared_by_shift for every row of a (columns, 26) histogram array at once"""
+    counts = np.asarray(counts, dtype=np.float64)
+    expected = counts.sum(axis=1, keepdims=True) * np.array(ENGLISH_FREQUENCIES)
+    rotated = counts[:, _ROTATIONS]  # (columns, shift, plaintext letter)
+    expected = expected[:, None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = ((rotated - expected) ** 2 / expected).sum(axis=2)
+    return np.nan_to_num(scores)
+
+def _minimal_period(shifts):
+    """Shortest repeating unit of a key ('lemonlemon' -> 'lemon')"""
+    for period in range(1, len(shifts) + 1):
+        if len(shifts) % period == 0 and shifts == shifts[:period] * (len(shifts) // period):
+            return shifts[:period]
+    return shifts
+
+def recover_vigenere_key(ciphertext, length):
+    """Best key of one length: each column is solved as an additive cipher"""
+    counts = column_counts(letter_indices(ciphertext), length)
+    shifts = [int(k) for k in chi_squared_columns(counts).argmin(axis=1)]
+    return ''.join(LETTERS[k] for k in _minimal_period(shifts))
+
+def refine_vigenere_key(letters, shifts):
+    """Improve a key column by column, keeping the shift with the best quadgram score.
+
+    letters is a 0-25 ciphertext sample; all 26 shifts of a column are scored as
+    one (26, n) batch. Returns the new shifts and their score.
+    """
+    shifts = list(shifts)
+    length = len(shifts)
+    key = np.tile(np.array(shifts, dtype=np.int64), -(-len(letters) // length))[:len(letters)]
+    plain = (letters - key) % 26
+    for column in range(length):
+        candidates = np.tile(plain, (26, 1))
+        candidates[:, column::length] = (letters[column::length] - np.arange(26)[:, None]) % 26
+        scores = score_letters(candidates)
+        shifts[column] = int(scores.argmax())
+        plain = candidates[shifts[column]]
+    return shifts, float(score_letters(plain))
+
+def crack_vigenere(ciphertext, max_len=MAX_KEY_LENGTH, top=3):
+    """Recover the most likely Vigenère keys, returning (key, log_probability, plaintext) tuples.
+
+    The best key lengths are solved column by column with chi-squared, then each
+    key is refined and ranked with the quadgram model.
+    """
+    letters = _sample_letters(ciphertext)
+    candidates = {}
+    for length, _, _ in rank_key_lengths(ciphertext, max_len):
+        key = recover_vigenere_key(ciphertext, length)
+        if key not in candidates:
+            shifts, score = refine_vigenere_key(letters, [LETTER_TO_INDEX[k] for k in key])
+            candidates[key] = (''.join(LETTERS[k] for k in _minimal_period(shifts)), score)
+            if len(candidates) == top * 2:
+                break
+    results = {}
+    for key, score in sorted(candidates.values(), key=lambda item: -item[1]):
+        if key not in results:
+            results[key] = (key, score, vigenere_translate(ciphertext, key, 'd'))
+    return list(results.values())[:top]
+
+# Auto-key - the seed only reaches the letters before the first non-letter
+def autokey_candidates(ciphertext):
+    """Decrypt with all 26 seeds at once, returning (plaintext for seed 0, heads).
+
+    With seed s every letter p[i] of the leading run is p[i] for seed 0 minus s
+    for even i and plus s for odd i, so one decryption plus a broadcast gives the
+    (26, run) array of ASCII heads; everything after the run is the same for all seeds.
+    """
+    data = _autokey_prepare(ciphertext).encode('ascii')
+    base = np.frombuffer(autokey_decrypt_bytes(data, 0)[0], dtype=np.uint8)
+    codes = np.frombuffer(data, dtype=np.uint8)
+    non_letters = np.flatnonzero((codes < 65) | (codes > 90))
+    run = int(non_letters[0]) if len(non_letters) else len(codes)
+    sign = 1 - 2 * (np.arange(run) & 1)
+    heads = (base[:run].astype(np.int64) - 65 - sign * np.arange(26)[:, None]) % 26 + 65
+    return base, heads.astype(np.uint8)
+
+def rank_autokey_keys(ciphertext):
+    """Return all 26 autokey seeds as (seed, log_probability) pairs, best first"""
+    if HAVE_NUMPY and ciphertext.isascii():
+        base, heads = autokey_candidates(ciphertext)
+        heads = heads[:, :QUADGRAM_SAMPLE].astype(np.int64) - 65
+        tail = base[heads.shape[1]:]
+        tail = tail[(tail >= 65) & (tail <= 90)][:QUADGRAM_SAMPLE - heads.shape[1]].astype(np.int64) - 65
+        letters = np.concatenate((heads, np.tile(tail, (26, 1))), axis=1)
+        scores = score_letters(letters).tolist()
+    else:
+        scores = [float(score_letters(_sample_letters(autokey_decrypt_fast(ciphertext, seed)))) for seed in range(26)]
+    return sorted(enumerate(scores), key=lambda item: -item[1])
+
+def crack_autokey(ciphertext, top=5):
+    """Recover the most likely autokey seeds, returning (seed, log_probability, plaintext) tuples"""
+    return [(seed, score, autokey_decrypt_fast(ciphertext, seed))
+            for seed, score in rank_autokey_keys(ciphertext)[:top]]
+
+# Crib search - letter differences do not change under an additive shift
+def _letter_positions(text):
+    """Character offsets of the a-z/A-Z letters of a text and their 0-25 values"""
+    if HAVE_NUMPY:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+        lowered = codes | 0x20  # ASCII letters only differ from their lowercase in bit 5
+        positions = np.flatnonzero((lowered >= 97) & (lowered <= 122) & (codes <= 122))
+        return positions, (lowered[positions] - 97).astype(np.uint8)
+    positions = [i for i, c in enumerate(text) if c.lower() in LETTER_TO_INDEX]
+    return positions, bytes(LETTER_TO_INDEX[text[i].lower()] for i in positions)
+
+def _differences(letters):
+    """Successive differences (b - a) % 26 of 0-25 letters, as bytes a-z"""
+    if HAVE_NUMPY and not isinstance(letters, bytes):
+        return ((letters[1:].astype(np.int16) - letters[:-1]) % 26 + 97).astype(np.uint8).tobytes()
+    return bytes((b - a) % 26 + 97 for a, b in zip(letters, letters[1:]))
+
+def crib_search(text, cribs):
+    """Find every place a crib appears in a text under any additive key.
+
+    The text and every crib are reduced to successive letter differences, so a
+    single substring scan per crib finds the matches for all 26 keys. Returns
+    (offset, crib, key) tuples sorted by offset, where offset is the character
+    index of the first letter of the match.
+    """
+    if isinstance(cribs, str):
+        cribs = [cribs]
+    positions, letters = _letter_positions(text)
+    stream = _differences(letters)
+    matches = []
+    for crib in cribs:
+        crib_letters = [LETTER_TO_INDEX[c] for c in crib.lower() if c in LETTER_TO_INDEX]
+        if len(crib_letters) < 2:
+            raise ValueError(f"Crib '{crib}' needs at least two letters")
+        pattern = _differences(bytes(crib_letters))
+        start = stream.find(pattern)
+        while start != -1:
+            matches.append((int(positions[start]), crib, (int(letters[start]) - crib_letters[0]) % 26))
+            start = stream.find(pattern, start + 1)
+    return sorted(matches)
+
+def crib_search_file(path, cribs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """crib_search over a text file of any size, read chunk by chunk.
+
+    Each chunk is searched together with the tail of the previous one so matches
+    across chunk boundaries are found exactly once. Offsets are character offsets
+    in the file.
+    """
+    if isinstance(cribs, str):
+        cribs = [cribs]
+    longest = max(sum(c in LETTER_TO_INDEX for c in crib.lower()) for crib in cribs)
+    matches = []
+    # Only letters take part in a match, so just the last longest - 1 letters already
+    # searched are carried, with their file offsets - however far apart they are
+    carry = ''
+    carry_offsets = []
+    chunk_offset = 0
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer = carry + chunk
+            positions, _ = _letter_positions(buffer)
+            
+            def file_offset(offset):
+                return carry_offsets[offset] if offset < len(carry) else chunk_offset + offset - len(carry)
+            
+            for offset, crib, key in crib_search(buffer, cribs):
+                # Skip matches made only of carried letters - they were reported last time
+                if offset + sum(c in LETTER_TO_INDEX for c in crib.lower()) > len(carry):
+                    matches.append((file_offset(offset), crib, key))
+            kept = [int(p) for p in positions[len(positions) - min(len(positions), longest - 1):]]
+            carry_offsets = [file_offset(p) for p in kept]
+            carry = ''.join(buffer[p] for p in kept)
+            chunk_offset += len(chunk)
+    return sorted(matches)
+
+# Known plaintext - under a Vigenère key (c - p) % 26 repeats with the key period
+def vigenere_known_plaintext(ciphertext, crib, max_period=None):
+    """Find every offset where a crib fits the ciphertext under a periodic Vigenère key.
+
+    The crib is slid over every letter offset at once: for each period P the
+    offsets where (c - p) % 26 repeats after P letters are narrowed down one
+    crib letter at a time, and each offset keeps its shortest period. The key
+    must repeat at least once inside the crib, so max_period defaults to half
+    its length. Returns (offset, key) tuples sorted by key length then offset,
+    with keys in the '11, 4, 12' numeric format ('7,' for a single value)
+    aligned to the first letter of the ciphertext.
+    """
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is required for known-plaintext Vigenère analysis")
+    crib_letters = np.array([LETTER_TO_INDEX[c] for c in crib.lower() if c in LETTER_TO_INDEX], dtype=np.int64)
+    m = len(crib_letters)
+    if m < 2:
+        raise ValueError("Crib needs at least two letters")
+    max_period = min(max_period or m // 2, m - 1) or 1
+    positions, letters = _letter_positions(ciphertext)
+    letters = letters.astype(np.int16)
+    crib_letters = crib_letters.astype(np.int16)
+    count = len(letters) - m + 1
+    if count <= 0:
+        return []
+    
+    found = {}  # Letter offset -> period
+    for period in range(1, max_period + 1):
+        # First crib letter with plain slices over every offset, then only the survivors
+        first = (letters[period:period + count] - letters[:count]
+                 - crib_letters[period] + crib_letters[0]) % 26 == 0
+        offsets = np.flatnonzero(first)
+        for j in range(1, m - period):
+            # Key letter at crib position j equals the one at j + period
+            same = (letters[offsets + j + period] - crib_letters[j + period]
+                    - letters[offsets + j] + crib_letters[j]) % 26 == 0
+            offsets = offsets[same]
+            if not len(offsets):
+                break
+        for offset in offsets.tolist():
+            found.setdefault(offset, period)
+    
+    results = []
+    for offset, period in found.items():
+        segment = (letters[offset:offset + period] - crib_letters[:period]) % 26
+        key = np.roll(segment, offset % period)  # Key value for letter t is segment[(t - offset) % period]
+        results.append((period, int(positions[offset]), ', '.join(str(int(k)) for k in key) + (',' if period == 1 else '')))
+    return [(offset, key) for _, offset, key in sorted(results)]
+
+# Parallel key search - candidate keys are scored by worker processes that share the ciphertext
+ATTACK_SAMPLE = 200  # Letters scored per candidate key in the search
+ATTACK_BATCH = 4096  # Keys scored per vectorized batch
+ATTACK_TASK = 1 << 18  # Keys per exhaustive task handed to a worker
+ATTACK_WORDS = 1024  # Dictionary words per task
+DEFAULT_THRESHOLD = -4.8  # Mean quadgram log-probability; English is near -3.8, noise near -7.6
+
+def dictionary_keys(max_len):
+    """Every dictionary word of at most max_len letters, as Vigenère key candidates"""
+    from word_index import load_index
+    return sorted({word for words in load_index().values() for word in words if len(word) <= max_len})
+
+def _key_batches(task):
+    """Yield (keys, count) batches of a task as 2-D arrays of 0-25 key values"""
+    if task[0] == 'words':
+        words = task[1]
+        for start in range(0, len(words), ATTACK_BATCH):
+            batch = words[start:start + ATTACK_BATCH]
+            for length in sorted({len(word) for word in batch}):
+                same = [word for word in batch if len(word) == length]
+                keys = np.frombuffer(''.join(same).encode('ascii'), dtype=np.uint8).reshape(len(same), length) - 97
+                yield keys, len(same)
+    else:
+        _, length, start, end = task
+        powers = 26 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+        for batch_start in range(start, end, ATTACK_BATCH):
+            index = np.arange(batch_start, min(batch_start + ATTACK_BATCH, end), dtype=np.int64)
+            yield (index[:, None] // powers) % 26, len(index)
+
+def _ignore_interrupts():
+    """Worker initializer: Ctrl+C is handled by the parent, which cancels the search"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _attack_task(name, size, task, threshold, top):
+    """Worker: score every key of a task, stopping early once any worker passes the threshold.
+
+    Byte 0 of the shared block is the stop flag; the ciphertext letters follow it.
+    A threshold of None scores every key.
+    Returns (best (fitness, key) pairs, keys scored, whether the threshold was passed).
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf[1:1 + min(size, ATTACK_SAMPLE)] as view:
+            letters = np.frombuffer(view, dtype=np.uint8).astype(np.int16)
+        best = []
+        scored = 0
+        for keys, count in _key_batches(task):
+            if shm.buf[0]:
+                break
+            columns = np.arange(len(letters)) % keys.shape[1]
+            plain = (letters - keys[:, columns]) % 26
+            fitness = score_letters(plain) / max(len(letters) - 3, 1)
+            order = np.argsort(-fitness)[:top]
+            best.extend((float(fitness[i]), ''.join(LETTERS[k] for k in keys[i])) for i in order)
+            best = sorted(best, reverse=True)[:top]
+            scored += count
+            if threshold is not None and best and best[0][0] >= threshold:
+                shm.buf[0] = 1
+                return best, scored, True
+        return best, scored, False
+    finally:
+        shm.close()
+
+def vigenere_attack(ciphertext, max_len=6, workers=None, exhaustive=False, threshold=DEFAULT_THRESHOLD,
+                    top=3, progress=None, cancel=None):
+    """Search Vigenère keys in a process pool, scoring each with the quadgram model.
+
+    Candidates are the dictionary words of at most max_len letters, or with
+    exhaustive=True every key of length 1..max_len (26^6 is about 3*10^8, so long
+    exhaustive searches take a while). The ciphertext letters live in one shared
+    memory block that every worker attaches to. The dictionary is always scored
+    in full; an exhaustive search stops as soon as a key reaches the threshold
+    fitness. Either stops when cancel (an object with is_set(), such as
+    threading.Event) is set. progress(done, total) is called as tasks finish.
+    The best keys are refined column by column with the quadgram model, so a
+    near-miss word still leads to the right key. Returns (key, log_probability,
+    plaintext) tuples, best first.
+    """
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is required for the parallel Vigenère attack")
+    letters = letter_indices(ciphertext)
+    if not len(letters):
+        raise ValueError("Ciphertext contains no letters")
+    if exhaustive:
+        tasks = [('range', length, start, min(start + ATTACK_TASK, 26 ** length))
+                 for length in range(1, max_len + 1) for start in range(0, 26 ** length, ATTACK_TASK)]
+        total = sum(task[3] - task[2] for task in tasks)
+    else:
+        words = dictionary_keys(max_len)
+        tasks = [('words', words[start:start + ATTACK_WORDS]) for start in range(0, len(words), ATTACK_WORDS)]
+        total = len(words)
+        threshold = None
+    
+    shm = shared_memory.SharedMemory(create=True, size=len(letters) + 1)
+    try:
+        shm.buf[0] = 0
+        shm.buf[1:1 + len(letters)] = letters.tobytes()
+        best = []
+        done = 0
+        with ProcessPoolExecutor(max_workers=max(1, min(workers or os.cpu_count() or 1, len(tasks))),
+                                 initializer=_ignore_interrupts) as pool:
+            pending = {pool.submit(_attack_task, shm.name, len(letters), task, threshold, top * 2) for task in tasks}
+            while pending:
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if future.cancelled():
+                        continue
+                    results, scored, passed = future.result()
+                    best = sorted(best + results, reverse=True)[:top * 2]
+                    done += scored
+                    if passed:
+                        shm.buf[0] = 1
+                if progress:
+                    progress(done, total)
+                if shm.buf[0] or (cancel is not None and cancel.is_set()):
+                    shm.buf[0] = 1  # Running workers stop at their next batch
+                    for future in pending:
+                        future.cancel()
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    sample = _sample_letters(ciphertext)
+    results = {}
+    for _, key in best:
+        shifts, score = refine_vigenere_key(sample, [LETTER_TO_INDEX[c] for c in key])
+        key = ''.join(LETTERS[k] for k in _minimal_period(shifts))
+        if key not in results:
+            results[key] = (key, score, vigenere_translate(ciphertext, key, 'd'))
+    return sorted(results.values(), key=lambda result: -result[1])[:top]
@@ -1,6 +1,9 @@
 import pygame
 import sys
 import random
+from bisect import bisect_right
+from quadgrams import quadgram_score, table_available
+from button import load_font, render_text
 
 # Initialize Pygame
 pygame.init()
@@ -25,11 +28,13 @@ PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 
 # Fonts
-title_font = pygame.font.Font(None, 48)
-button_font = pygame.font.Font(None, 32)
-text_font = pygame.font.Font(None, 24)
-hint_font = pygame.font.Font(None, 28)
-blank_font = pygame.font.Font(None, 32)
+title_font = load_font(None, 48)
+button_font = load_font(None, 32)
+text_font = load_font(None, 24)
+hint_font = load_font(None, 28)
+blank_font = load_font(None, 32)
+small_font = load_font(None, 18)
+detail_font = load_font(None, 20)
 
 class CipherGame:
     def __init__(self, main_screen=None):
@@ -59,6 +64,7 @@ class CipherGame:
         self.level = 1
         self.streak = 0  # Consecutive correct answers
         self.hints_used = 0  # Track hints used
+        self.difficulty = 1  # Estimated difficulty of the current challenge (1-5)
         
         # Blank input boxes
         self.blank_boxes = {}
@@ -82,6 +88,12 @@ class CipherGame:
             4: ["MASTER THE CIPHER TECHNIQUES", "ADVANCED CRYPTOGRAPHIC METHODS", "COMPLEX CIPHER CHALLENGES"],
             5: ["PROFESSIONAL ENCRYPTION ALGORITHMS", "SOPHISTICATED DECRYPTION PROCEDURES", "ULTIMATE CRYPTANALYSIS EXPERTISE"]
         }
+        
+        # Difficulty is rated against the game's own phrases: the surprise values that split them into fifths
+        self.difficulty_cutoffs = None  # Without the quadgram table difficulty follows length
+        if table_available():
+            surprises = sorted(-quadgram_score(text) for texts in self.sample_texts.values() for text in texts)
+            self.difficulty_cutoffs = [surprises[len(surprises) * k // 5] for k in range(1, 5)]
     
     def caesar_cipher(self, text, shift, decrypt=False):
         """Apply Caesar cipher to text"""
@@ -123,6 +135,18 @@ class CipherGame:
         
         return "".join(display_chars)
     
+    def estimate_difficulty(self, text):
+        """Rate a text 1-5 by its total quadgram surprise, relative to the game's phrases.
+
+        Per-letter fitness is noise on phrases this short; the total grows with both
+        length and unusual letter sequences, which is what makes a phrase harder.
+        Without the quadgram table the rating goes up one step per six letters past eight.
+        """
+        if self.difficulty_cutoffs is None:
+            letters = sum(char.isalpha() for char in text)
+            return min(5, 1 + max(0, letters - 8) // 6)
+        return 1 + bisect_right(self.difficulty_cutoffs, -quadgram_score(text))
+    
     def generate_challenge(self):
         """Generate a new cipher challenge with blanks"""
         self.cipher_key = random.randint(1, 25)
@@ -130,6 +154,7 @@ class CipherGame:
         # Select text based on level
         level_key = min(self.level, 5)  # Cap at level 5 for text selection
         self.original_text = random.choice(self.sample_texts[level_key])
+        self.difficulty = self.estimate_difficulty(self.original_text)
         
         if self.game_mode == "encrypt":
             # Show original text, user fills blanks in cipher
@@ -193,7 +218,7 @@ class CipherGame:
             pygame.draw.rect(self.screen, BLACK, button_rect, 2)  # Black border
         
         # Draw button text
-        text_surface = text_font.render(text, True, WHITE)
+        text_surface = render_text(text_font, text, True, WHITE)
         text_rect = text_surface.get_rect(center=button_rect.center)
         self.screen.blit(text_surface, text_rect)
     
@@ -215,14 +240,14 @@ class CipherGame:
             self.screen.fill(WHITE)
         
         # Title with enhanced styling - centered for fullscreen
-        title_text = title_font.render("Cipher Challenge Game", True, WHITE)
-        title_shadow = title_font.render("Cipher Challenge Game", True, BLACK)
+        title_text = render_text(title_font, "Cipher Challenge Game", True, WHITE)
+        title_shadow = render_text(title_font, "Cipher Challenge Game", True, BLACK)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
         shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + 2, SCREEN_HEIGHT//4 + 2))
         self.screen.blit(title_shadow, shadow_rect)
         self.screen.blit(title_text, title_rect)
         
-        subtitle_text = text_font.render("Fill in the Blanks Edition", True, CYAN)
+        subtitle_text = render_text(text_font, "Fill in the Blanks Edition", True, CYAN)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 40))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -238,7 +263,7 @@ class CipherGame:
         
         start_y = SCREEN_HEIGHT//4 + 80
         for i, instruction in enumerate(instructions):
-            text_surface = text_font.render(instruction, True, WHITE)
+            text_surface = render_text(text_font, instruction, True, WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH//2, start_y + i * 25))
             self.screen.blit(text_surface, text_rect)
         
@@ -247,11 +272,11 @@ class CipherGame:
         self.draw_button(self.decrypt_button, "DECRYPT", RED)
         
         # Enhanced score display - bottom of screen
-        score_text = text_font.render(f"Score: {self.score} | Level: {self.level} | Streak: {self.streak}", True, WHITE)
+        score_text = render_text(text_font, f"Score: {self.score} | Level: {self.level} | Streak: {self.streak}", True, WHITE)
         self.screen.blit(score_text, (50, SCREEN_HEIGHT - 50))
         
         # Go to main.py instruction
-        exit_text = text_font.render("Press ESC to return to main menu", True, WHITE)
+        exit_text = render_text(text_font, "Press ESC to return to main menu", True, WHITE)
         exit_rect = exit_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
         self.screen.blit(exit_text, exit_rect)
     
@@ -284,17 +309,17 @@ class CipherGame:
                 
                 # Draw user input in box
                 if i in self.user_inputs and self.user_inputs[i]:
-                    input_surface = blank_font.render(self.user_inputs[i], True, BLACK)
+                    input_surface = render_text(blank_font, self.user_inputs[i], True, BLACK)
                     input_rect = input_surface.get_rect(center=box.center)
                     self.screen.blit(input_surface, input_rect)
                 else:
                     # Draw underscore placeholder in the box
-                    placeholder_surface = blank_font.render("_", True, GRAY)
+                    placeholder_surface = render_text(blank_font, "_", True, GRAY)
                     placeholder_rect = placeholder_surface.get_rect(center=box.center)
                     self.screen.blit(placeholder_surface, placeholder_rect)
             else:
                 # Draw normal character with enhanced visibility
-                char_surface = button_font.render(char, True, YELLOW)
+                char_surface = render_text(button_font, char, True, YELLOW)
                 self.screen.blit(char_surface, (char_x, y))
     
     def draw_game(self):
@@ -319,20 +344,20 @@ class CipherGame:
         
         # Title with enhanced styling - adjusted for fullscreen
         mode_text = "ENCRYPTION" if self.game_mode == "encrypt" else "DECRYPTION"
-        title_text = title_font.render(f"{mode_text} Challenge", True, WHITE)
-        title_shadow = title_font.render(f"{mode_text} Challenge", True, BLACK)
+        title_text = render_text(title_font, f"{mode_text} Challenge", True, WHITE)
+        title_shadow = render_text(title_font, f"{mode_text} Challenge", True, BLACK)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 80))
         shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH//2 + 2, 82))
         self.screen.blit(title_shadow, shadow_rect)
         self.screen.blit(title_text, title_rect)
         
         # Enhanced level and score display
-        level_text = text_font.render(f"Level: {self.level} | Score: {self.score} | Streak: {self.streak}", True, WHITE)
+        level_text = render_text(text_font, f"Level: {self.level} | Difficulty: {self.difficulty}/5 | Score: {self.score} | Streak: {self.streak}", True, WHITE)
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH//2, 120))
         self.screen.blit(level_text, level_rect)
         
         # Key hint with enhanced styling
-        hint_text = hint_font.render(f"Key Hint: {self.cipher_key}", True, CYAN)
+        hint_text = render_text(hint_font, f"Key Hint: {self.cipher_key}", True, CYAN)
         hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH//2, 160))
         self.screen.blit(hint_text, hint_rect)
         
@@ -347,16 +372,16 @@ class CipherGame:
             fill_label = "Fill the missing letters in the plain text:"
         
         # Display given text with enhanced visibility - centered
-        label_surface = text_font.render(challenge_label, True, WHITE)
+        label_surface = render_text(text_font, challenge_label, True, WHITE)
         label_rect = label_surface.get_rect(center=(SCREEN_WIDTH//2, 200))
         self.screen.blit(label_surface, label_rect)
         
-        given_surface = button_font.render(given_text, True, YELLOW)
+        given_surface = render_text(button_font, given_text, True, YELLOW)
         given_rect = given_surface.get_rect(center=(SCREEN_WIDTH//2, 230))
         self.screen.blit(given_surface, given_rect)
         
         # Display text with blanks to fill - centered
-        fill_surface = text_font.render(fill_label, True, WHITE)
+        fill_surface = render_text(text_font, fill_label, True, WHITE)
         fill_rect = fill_surface.get_rect(center=(SCREEN_WIDTH//2, 280))
         self.screen.blit(fill_surface, fill_rect)
         
@@ -369,7 +394,7 @@ class CipherGame:
         self.draw_button(self.hint_button, "HINT", hint_color)
         
         # Hint counter
-        hint_text = pygame.font.Font(None, 18).render(f"Hints: {2 - self.hints_used}/2", True, WHITE)
+        hint_text = render_text(small_font, f"Hints: {2 - self.hints_used}/2", True, WHITE)
         self.screen.blit(hint_text, (self.hint_button.x, self.hint_button.y + 35))
         
         # Enhanced instructions - centered for fullscreen
@@ -382,7 +407,7 @@ class CipherGame:
         
         start_y = SCREEN_HEIGHT//2 + 100
         for i, instruction in enumerate(instructions):
-            text_surface = pygame.font.Font(None, 20).render(instruction, True, WHITE)
+            text_surface = render_text(detail_font, instruction, True, WHITE)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH//2, start_y + i * 25))
             self.screen.blit(text_surface, text_rect)
         
@@ -392,11 +417,11 @@ class CipherGame:
         self.draw_button(self.submit_button, "SUBMIT", button_color)
         
         if not all_filled:
-            status_text = text_font.render("Fill all blanks to submit", True, RED)
+            status_text = render_text(text_font, "Fill all blanks to submit", True, RED)
             status_rect = status_text.get_rect(center=(SCREEN_WIDTH//2, self.submit_button.y + 45))
             self.screen.blit(status_text, status_rect)
         else:
-            ready_text = text_font.render("Ready to submit!", True, GREEN)
+            ready_text = render_text(text_font, "Ready to submit!", True, GREEN)
             ready_rect = ready_text.get_rect(center=(SCREEN_WIDTH//2, self.submit_button.y + 45))
             self.screen.blit(ready_text, ready_rect)
     
@@ -438,17 +463,17 @@ class CipherGame:
             result_title = "INCORRECT!"
             title_color = RED
             
-        title_text = title_font.render(result_title, True, title_color)
+        title_text = render_text(title_font, result_title, True, title_color)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
         self.screen.blit(title_text, title_rect)
         
         # Show the correct answer - centered
-        answer_text = text_font.render(f"Correct answer: {self.target_text}", True, WHITE)
+        answer_text = render_text(text_font, f"Correct answer: {self.target_text}", True, WHITE)
         answer_rect = answer_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 70))
         self.screen.blit(answer_text, answer_rect)
         
         # Show user's answer - centered
-        user_text = text_font.render(f"Your answer: {user_answer_str}", True, WHITE)
+        user_text = render_text(text_font, f"Your answer: {user_answer_str}", True, WHITE)
         user_rect = user_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 110))
         self.screen.blit(user_text, user_rect)
         
@@ -460,14 +485,14 @@ class CipherGame:
             status = "✓" if user_char == correct_char else "✗"
             blank_results.append(f"Position {pos+1}: {user_char} {status}")
         
-        results_text = text_font.render("Blank Results:", True, WHITE)
+        results_text = render_text(text_font, "Blank Results:", True, WHITE)
         results_rect = results_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 150))
         self.screen.blit(results_text, results_rect)
         
         start_y = SCREEN_HEIGHT//4 + 180
         for i, result in enumerate(blank_results):
             color = GREEN if "✓" in result else RED
-            result_surface = pygame.font.Font(None, 20).render(result, True, color)
+            result_surface = render_text(detail_font, result, True, color)
             result_rect = result_surface.get_rect(center=(SCREEN_WIDTH//2, start_y + i * 25))
             self.screen.blit(result_surface, result_rect)
         
@@ -477,7 +502,7 @@ class CipherGame:
             streak_bonus = self.streak * 5 if self.streak > 1 else 0
             hint_penalty = self.hints_used * 5
             total_points = max(base_points + streak_bonus - hint_penalty, 5)
-            score_text = text_font.render(f"+{total_points} points! (Base: {base_points}, Streak: +{streak_bonus}, Hints: -{hint_penalty})", True, GREEN)
+            score_text = render_text(text_font, f"+{total_points} points! (Base: {base_points}, Streak: +{streak_bonus}, Hints: -{hint_penalty})", True, GREEN)
         else:
             # Partial credit
             correct_blanks = sum(1 for pos in self.blank_positions 
@@ -485,15 +510,15 @@ class CipherGame:
                                self.user_inputs[pos].upper() == self.target_text[pos])
             if correct_blanks > 0:
                 partial_points = (correct_blanks * 5 * self.level) // len(self.blank_positions)
-                score_text = text_font.render(f"+{partial_points} points (partial credit)", True, BLUE)
+                score_text = render_text(text_font, f"+{partial_points} points (partial credit)", True, BLUE)
             else:
-                score_text = text_font.render("No points this time", True, RED)
+                score_text = render_text(text_font, "No points this time", True, RED)
         
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
         self.screen.blit(score_text, score_rect)
         
         # Current score - centered
-        current_score_text = text_font.render(f"Total Score: {self.score}", True, WHITE)
+        current_score_text = render_text(text_font, f"Total Score: {self.score}", True, WHITE)
         current_score_rect = current_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 120))
         self.screen.blit(current_score_text, current_score_rect)
         
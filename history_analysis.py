@@ -0,0 +1,129 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from cipher_engine import LETTERS, get_key
+from cryptanalysis import (_minimal_period, _sample_letters, crack_additive, crack_autokey, crack_vigenere,
+                           rank_additive_keys, rank_autokey_keys)
+
+HISTORY_PATH = "cipher_history.json"
+READ_SIZE = 1 << 16  # Characters read from the history file at a time
+# Calibrated on game-length phrases (10-60 letters) encrypted with each cipher
+VIGENERE_KEY_PENALTY = 3.0  # Fitness charged per extra Vigenère key letter per ciphertext letter
+NOISE_FITNESS = -6.75  # Mean quadgram log-probability below which no reading is English
+
+CIPHER_TYPES = {
+    'Additive Cipher': 'additive',
+    'Auto-Key Cipher': 'autokey',
+    'Vigenère Cipher': 'vigenere',
+}
+
+def iter_history(path=HISTORY_PATH):
+    """Yield the entries of a JSON history array one by one without loading the whole file"""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        started = False
+        while True:
+            data = f.read(READ_SIZE)
+            buffer += data
+            while True:
+                buffer = buffer.lstrip()
+                if not started:
+                    if not buffer:
+                        break
+                    if buffer[0] != '[':
+                        raise ValueError("History file must contain a JSON array")
+                    buffer = buffer[1:]
+                    started = True
+                    continue
+                if buffer[:1] == ',':
+                    buffer = buffer[1:].lstrip()
+                if buffer[:1] == ']':
+                    return
+                try:
+                    entry, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    break  # Entry continues in the next read
+                yield entry
+                buffer = buffer[end:]
+            if not data:
+                if buffer.strip():
+                    raise ValueError("History file ends in the middle of an entry")
+                return
+
+def _fitness(score, text):
+    return score / max(len(_sample_letters(text)) - 3, 1)
+
+def classify_ciphertext(ciphertext):
+    """Guess 'additive', 'autokey', 'vigenere' or 'unknown' by comparing the best reading under each cipher.
+
+    A longer Vigenère key fits a short text more closely whatever its cipher, so
+    the Vigenère fitness is docked VIGENERE_KEY_PENALTY for every extra key letter,
+    spread over the letters of the text. Only the winning reading is held to an
+    absolute bar: below NOISE_FITNESS the text is 'unknown'.
+    """
+    letters = len(_sample_letters(ciphertext))
+    if letters < 4:
+        return 'unknown'
+    additive_fit = _fitness(rank_additive_keys(ciphertext)[0][1], ciphertext)
+    autokey_fit = _fitness(rank_autokey_keys(ciphertext)[0][1], ciphertext)
+    key, score, _ = crack_vigenere(ciphertext, top=1)[0]
+    vigenere_fit = _fitness(score, ciphertext) - VIGENERE_KEY_PENALTY * (len(key) - 1) / letters
+    readings = {'additive': additive_fit, 'autokey': autokey_fit, 'vigenere': vigenere_fit}
+    best = max(readings, key=readings.get)  # Ties go to the simpler cipher, in insertion order
+    return best if readings[best] >= NOISE_FITNESS else 'unknown'
+
+def _same_key(cipher, stored, recovered):
+    """Compare a stored key with a recovered one as the cipher would use them"""
+    key = get_key(stored)
+    if cipher == 'additive':
+        return key.additive % 26 == recovered
+    if cipher == 'autokey':
+        return key.autokey % 26 == recovered
+    shifts = _minimal_period([k % 26 for k in key.vigenere])
+    return ''.join(LETTERS[k] for k in shifts) == recovered
+
+def analyze_entry(entry):
+    """Classify and crack one history entry, comparing the result with its stored key"""
+    encrypted = entry.get('operation') == 'Encryption'
+    ciphertext = entry['result'] if encrypted else entry['plaintext']
+    stored_type = CIPHER_TYPES.get(entry.get('cipher_type'))
+    report = {
+        'timestamp': entry.get('timestamp'),
+        'stored_type': stored_type,
+        'stored_key': entry.get('key'),
+    }
+    try:
+        detected = classify_ciphertext(ciphertext)
+        if detected == 'unknown':
+            key = None
+        elif detected == 'additive':
+            key = crack_additive(ciphertext, top=1)[0][0]
+        elif detected == 'autokey':
+            key = crack_autokey(ciphertext, top=1)[0][0]
+        else:
+            key = crack_vigenere(ciphertext, top=1)[0][0]
+        report['detected_type'] = detected
+        report['recovered_key'] = key
+        report['match'] = detected == stored_type and _same_key(detected, entry.get('key'), key)
+    except Exception as e:
+        report['error'] = str(e)
+        report['match'] = False
+    return report
+
+def analyze_history(path=HISTORY_PATH, workers=None):
+    """Analyze every history entry in a process pool, yielding reports in file order.
+
+    Only a bounded window of entries is in flight at once, so the history is
+    streamed rather than loaded.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for entry in iter_history(path):
+            window.append(pool.submit(analyze_entry, entry))
+            if len(window) >= workers * 4:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
@@ -3,13 +3,19 @@ import sys
 import os
 import json
 import math
+from collections import OrderedDict
 from datetime import datetime
-from button import Button, get_font, load_image
+from button import Button, Label, get_font, load_image, preload_fonts, render_text
 from game import CipherGame
+from cipher_engine import (parse_additive_key, parse_autokey_key, parse_vigenere_key, additive_translate,
+                           vigenere_translate, autokey_encrypt_fast, autokey_decrypt_fast, SolutionSteps)
+from cryptanalysis import rank_additive_keys, rank_autokey_keys
+from word_index import suggest_keys
 
 
 pygame.init()
 pygame.mixer.init()
+preload_fonts()
 
 # Get native display info for fullscreen
 info = pygame.display.Info()
@@ -61,31 +67,99 @@ pygame.display.set_caption("Alphanumeric Cipher System - Fullscreen")
 # Create a simple background color instead of loading image
 BG_COLOR = (50, 50, 100)  # Dark blue background
 
+# Rendered gradients keyed on (size, color1, color2), drawn once per resolution
+_gradient_cache = {}
+
 def draw_gradient_background(surface, color1, color2):
     """Draw a gradient background"""
     width = surface.get_width()
     height = surface.get_height()
+    key = (width, height, tuple(color1), tuple(color2))
+    gradient = _gradient_cache.get(key)
+    if gradient is None:
+        gradient = pygame.Surface((width, height), 0, surface)
+        for y in range(height):
+            ratio = y / height
+            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+            pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+        _gradient_cache[key] = gradient
+    surface.blit(gradient, (0, 0))
+
+# Glow layers drawn around a rect, each 2px further out and fainter (alpha 42, 34, 26, 18, 10).
+# They nest, so a pixel under the outer k layers gets GLOW_ALPHAS[k - 1]: the single-blend
+# alpha closest to blending those k layers one after another (at most 3 levels off).
+GLOW_LAYERS = 5
+GLOW_ALPHAS = (10, 28, 51, 79, 108)
+GLOW_SPRITE_CACHE_SIZE = 64
+_glow_slices = {}
+_glow_sprites = OrderedDict()
+
+def render_glow(size, glow_color, radius):
+    """The glow layers for a rect of size as one alpha surface"""
+    width, height = size
+    pad = GLOW_LAYERS * 2
+    sprite = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+    for layers, i in enumerate(range(GLOW_LAYERS, 0, -1), 1):
+        glow_rect = pygame.Rect(pad - i*2, pad - i*2, width + i*4, height + i*4)
+        pygame.draw.rect(sprite, (*glow_color, GLOW_ALPHAS[layers - 1]), glow_rect, border_radius=radius)
+    return sprite
+
+def glow_sprite(size, glow_color, border_width=3, radius=8):
+    """Glow sprite for a rect of size, assembled from a cached nine-slice source.
+
+    Outside its corners the glow is constant along each edge, so corners are copied
+    from the source, edges are stretched from a one-pixel strip and the center is
+    a single fill. Assembled sprites are kept per size with LRU eviction.
+    """
+    key = (tuple(glow_color), border_width, radius, tuple(size))
+    sprite = _glow_sprites.get(key)
+    if sprite is not None:
+        _glow_sprites.move_to_end(key)
+        return sprite
     
-    for y in range(height):
-        ratio = y / height
-        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+    corner = GLOW_LAYERS * 2 + radius
+    width, height = size[0] + GLOW_LAYERS * 4, size[1] + GLOW_LAYERS * 4
+    if width <= corner * 2 or height <= corner * 2:
+        sprite = render_glow(size, glow_color, radius)
+    else:
+        source = _glow_slices.get(key[:3])
+        if source is None:
+            source = render_glow((radius * 2 + 1, radius * 2 + 1), glow_color, radius)
+            _glow_slices[key[:3]] = source
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        far_x, far_y = width - corner, height - corner
+        span_x, span_y = width - corner * 2, height - corner * 2
+        # BLEND_RGBA_MAX onto the transparent sprite copies the pixels exactly
+        for dest, area in (((0, 0), (0, 0)), ((far_x, 0), (corner + 1, 0)),
+                           ((0, far_y), (0, corner + 1)), ((far_x, far_y), (corner + 1, corner + 1))):
+            sprite.blit(source, dest, (*area, corner, corner), special_flags=pygame.BLEND_RGBA_MAX)
+        for dest, area, stretch in (((corner, 0), (corner, 0, 1, corner), (span_x, corner)),
+                                    ((corner, far_y), (corner, corner + 1, 1, corner), (span_x, corner)),
+                                    ((0, corner), (0, corner, corner, 1), (corner, span_y)),
+                                    ((far_x, corner), (corner + 1, corner, corner, 1), (corner, span_y))):
+            edge = pygame.transform.scale(source.subsurface(area), stretch)
+            sprite.blit(edge, dest, special_flags=pygame.BLEND_RGBA_MAX)
+        sprite.fill(source.get_at((corner, corner)), (corner, corner, span_x, span_y))
+    
+    _glow_sprites[key] = sprite
+    if len(_glow_sprites) > GLOW_SPRITE_CACHE_SIZE:
+        _glow_sprites.popitem(last=False)
+    return sprite
 
-def draw_glowing_rect(surface, rect, color, glow_color, border_width=3):
+def draw_glowing_rect(surface, rect, color, glow_color, border_width=3, radius=8):
     """Draw a rectangle with glowing border effect"""
-    # Draw multiple layers for glow effect
-    for i in range(5, 0, -1):
-        alpha = 50 - i * 8
-        glow_surf = pygame.Surface((rect.width + i*4, rect.height + i*4), pygame.SRCALPHA)
-        glow_rect = pygame.Rect(0, 0, rect.width + i*4, rect.height + i*4)
-        pygame.draw.rect(glow_surf, (*glow_color, alpha), glow_rect, border_radius=8)
-        surface.blit(glow_surf, (rect.x - i*2, rect.y - i*2))
+    # All glow layers come from one cached sprite, blitted in a single call
+    pad = GLOW_LAYERS * 2
+    surface.blit(glow_sprite(rect.size, glow_color, border_width, radius), (rect.x - pad, rect.y - pad))
     
     # Draw main rectangle
-    pygame.draw.rect(surface, color, rect, border_radius=8)
-    pygame.draw.rect(surface, glow_color, rect, border_width, border_radius=8)
+    pygame.draw.rect(surface, color, rect, border_radius=radius)
+    pygame.draw.rect(surface, glow_color, rect, border_width, border_radius=radius)
+
+# Pre-rendered diagonal line layers keyed on screen size
+_line_layer_cache = {}
 
 def draw_animated_background(surface, time_offset=0):
     """Draw animated background with diagonal lines"""
@@ -100,15 +174,16 @@ def draw_animated_background(surface, time_offset=0):
     line_spacing = 150
     line_thickness = 2
     
-    for i in range(-height, width + height, line_spacing):
-        start_x = i + int(time_offset * 0.5) % line_spacing
-        start_y = 0
-        end_x = start_x + height
-        end_y = height
-        
-        line_surf = pygame.Surface((width, height), pygame.SRCALPHA)
-        pygame.draw.line(line_surf, line_color, (start_x, start_y), (end_x, end_y), line_thickness)
-        surface.blit(line_surf, (0, 0))
+    # The lines repeat every line_spacing pixels, so they are drawn once on a layer
+    # one spacing wider than the screen and scrolled by blitting it at an offset
+    layer = _line_layer_cache.get((width, height))
+    if layer is None:
+        layer = pygame.Surface((width + line_spacing, height), pygame.SRCALPHA)
+        for i in range(-height, width + height, line_spacing):
+            start_x = i + line_spacing
+            pygame.draw.line(layer, line_color, (start_x, 0), (start_x + height, height), line_thickness)
+        _line_layer_cache[(width, height)] = layer
+    surface.blit(layer, (int(time_offset * 0.5) % line_spacing - line_spacing, 0))
 
 # Save/Load functions for cipher history
 def save_cipher_result(cipher_type, cipher_class, operation, plaintext, key, result):
@@ -145,73 +220,56 @@ def load_cipher_history():
 def show_save_option_with_automation(result, result_type, cipher_type, cipher_class, operation, plaintext, key, cipher_name):
     """Enhanced save option with automation buttons for quick operations"""
     clock = pygame.time.Clock()
+
+    # Split long results into multiple lines
+    max_chars = 60
+    result_lines = []
+    if len(result) > max_chars:
+        for i in range(0, len(result), max_chars):
+            result_lines.append(result[i:i+max_chars])
+    else:
+        result_lines = [result]
+
+    # The screen's widgets are built once and only re-render when hovered
+    info_y = 140 + len(result_lines) * 30 + 30
+    button_y1 = info_y + 110
+    button_y2 = button_y1 + 90
+    button_y3 = button_y1 + 130
+    labels = [Label((SCREEN_WIDTH//2, 100), f"{result_type}:", get_font(25), "Green")]
+    labels += [Label((SCREEN_WIDTH//2, 140 + i * 30), line, get_font(20), "White") for i, line in enumerate(result_lines)]
+    labels += [
+        Label((SCREEN_WIDTH//2, info_y), f"Original: {plaintext[:50]}{'...' if len(plaintext) > 50 else ''}", get_font(16), "Cyan"),
+        Label((SCREEN_WIDTH//2, info_y + 25), f"Key: {str(key)}", get_font(16), "Cyan"),
+        Label((SCREEN_WIDTH//2, info_y + 70), "Save this result?", get_font(20), "Yellow"),
+        Label((SCREEN_WIDTH//2, button_y1 + 60), "Quick Actions:", get_font(18), "Orange"),
+    ]
+
+    # Save and Continue buttons (top row)
+    SAVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 - 100, button_y1), 
+                        text_input="SAVE", font=get_font(25), base_color="Green", hovering_color="White")
+    CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 100, button_y1), 
+                            text_input="CONTINUE", font=get_font(25), base_color="White", hovering_color="Red")
+
+    # Automation buttons (second and third rows)
+    SOLUTION_ENCRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, button_y2), 
+                                    text_input="ENCRYPT STEPS", font=get_font(20), base_color="Blue", hovering_color="White")
+    SOLUTION_DECRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 300, button_y2), 
+                                    text_input="DECRYPT STEPS", font=get_font(20), base_color="Purple", hovering_color="White")
+
+    # Back to menu button
+    BACK_MENU_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, button_y3), 
+                             text_input="BACK TO MENU", font=get_font(20), base_color="Gray", hovering_color="White")
+
+    buttons = [SAVE_BUTTON, CONTINUE_BUTTON, SOLUTION_ENCRYPT_BUTTON, 
+              SOLUTION_DECRYPT_BUTTON, BACK_MENU_BUTTON]
+
     while True:
         MOUSE_POS = pygame.mouse.get_pos()
         
         SCREEN.fill("black")
         
-        # Display the result first
-        title_text = get_font(25).render(f"{result_type}:", True, "Green")
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 100))
-        SCREEN.blit(title_text, title_rect)
-        
-        # Split long results into multiple lines
-        max_chars = 60
-        result_lines = []
-        if len(result) > max_chars:
-            for i in range(0, len(result), max_chars):
-                result_lines.append(result[i:i+max_chars])
-        else:
-            result_lines = [result]
-        
-        # Display result lines
-        for i, line in enumerate(result_lines):
-            line_surface = get_font(20).render(line, True, "White")
-            line_rect = line_surface.get_rect(center=(SCREEN_WIDTH//2, 140 + i * 30))
-            SCREEN.blit(line_surface, line_rect)
-        
-        # Display original text and key info
-        info_y = 140 + len(result_lines) * 30 + 30
-        info_text = get_font(16).render(f"Original: {plaintext[:50]}{'...' if len(plaintext) > 50 else ''}", True, "Cyan")
-        info_rect = info_text.get_rect(center=(SCREEN_WIDTH//2, info_y))
-        SCREEN.blit(info_text, info_rect)
-        
-        key_text = get_font(16).render(f"Key: {str(key)}", True, "Cyan")
-        key_rect = key_text.get_rect(center=(SCREEN_WIDTH//2, info_y + 25))
-        SCREEN.blit(key_text, key_rect)
-        
-        # Save option question
-        save_question = get_font(20).render("Save this result?", True, "Yellow")
-        save_rect = save_question.get_rect(center=(SCREEN_WIDTH//2, info_y + 70))
-        SCREEN.blit(save_question, save_rect)
-        
-        # Save and Continue buttons (top row)
-        button_y1 = info_y + 110
-        SAVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 - 100, button_y1), 
-                            text_input="SAVE", font=get_font(25), base_color="Green", hovering_color="White")
-        CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 100, button_y1), 
-                                text_input="CONTINUE", font=get_font(25), base_color="White", hovering_color="Red")
-        
-        # Automation buttons section
-        automation_label = get_font(18).render("Quick Actions:", True, "Orange")
-        automation_rect = automation_label.get_rect(center=(SCREEN_WIDTH//2, button_y1 + 60))
-        SCREEN.blit(automation_label, automation_rect)
-        
-        button_y2 = button_y1 + 90
-        button_y3 = button_y1 + 130
-        
-        # Automation buttons (second and third rows)
-        SOLUTION_ENCRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, button_y2), 
-                                        text_input="ENCRYPT STEPS", font=get_font(20), base_color="Blue", hovering_color="White")
-        SOLUTION_DECRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 300, button_y2), 
-                                        text_input="DECRYPT STEPS", font=get_font(20), base_color="Purple", hovering_color="White")
-        
-        # Back to menu button
-        BACK_MENU_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, button_y3), 
-                                 text_input="BACK TO MENU", font=get_font(20), base_color="Gray", hovering_color="White")
-        
-        buttons = [SAVE_BUTTON, CONTINUE_BUTTON, SOLUTION_ENCRYPT_BUTTON, 
-                  SOLUTION_DECRYPT_BUTTON, BACK_MENU_BUTTON]
+        for label in labels:
+            label.update(SCREEN)
         
         for button in buttons:
             button.changeColor(MOUSE_POS)
@@ -276,79 +334,67 @@ def show_result_with_solution_and_return(result, operation, text, key, steps):
     """Display solution with option to return to save screen"""
     clock = pygame.time.Clock()
     scroll_offset = 0
-    max_scroll = 0
+    
+    # Title and input information
+    input_info = f"Input: {text[:50]}{'...' if len(text) > 50 else ''}"
+    key_info = f"Key: {str(key)}"
+    result_info = f"Result: {result[:50]}{'...' if len(result) > 50 else ''}"
+    labels = [Label((SCREEN_WIDTH//2, 30), f"{operation} SOLUTION", get_font(25), "Green")]
+    info_y = 70
+    for info in [input_info, key_info, result_info]:
+        labels.append(Label((SCREEN_WIDTH//2, info_y), info, get_font(14), "Cyan"))
+        info_y += 20
+    labels.append(Label((SCREEN_WIDTH//2, info_y + 20), "Step-by-Step Solution:", get_font(20), "Yellow"))
+    
+    # Calculate scrolling
+    start_y = info_y + 50
+    line_height = 20
+    total_height = len(steps) * line_height
+    screen_height = SCREEN_HEIGHT - start_y - 100
+    max_scroll = max(0, total_height - screen_height)
+    
+    # Instructions
+    nav_text = "UP/DOWN: scroll | ESC: back to menu" if max_scroll > 0 else "ESC: back to menu"
+    labels.append(Label((SCREEN_WIDTH//2, SCREEN_HEIGHT - 30), nav_text, get_font(12), "Orange"))
+    
+    # Navigation buttons
+    button_y = SCREEN_HEIGHT - 80
+    
+    # Return to Save Options button (left)
+    RETURN_SAVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 - 150, button_y), 
+                               text_input="RETURN TO SAVE", font=get_font(18), 
+                               base_color="Orange", hovering_color="White")
+    
+    # Back to Menu button (right)
+    CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 150, button_y), 
+                             text_input="CONTINUE", font=get_font(18), 
+                             base_color="Green", hovering_color="White")
+    
+    buttons = [RETURN_SAVE_BUTTON, CONTINUE_BUTTON]
     
     while True:
         MOUSE_POS = pygame.mouse.get_pos()
         SCREEN.fill("black")
         
-        # Title
-        title_text = get_font(25).render(f"{operation} SOLUTION", True, "Green")
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 30))
-        SCREEN.blit(title_text, title_rect)
-        
-        # Input information
-        input_info = f"Input: {text[:50]}{'...' if len(text) > 50 else ''}"
-        key_info = f"Key: {str(key)}"
-        result_info = f"Result: {result[:50]}{'...' if len(result) > 50 else ''}"
-        
-        info_y = 70
-        for info in [input_info, key_info, result_info]:
-            info_surface = get_font(14).render(info, True, "Cyan")
-            info_rect = info_surface.get_rect(center=(SCREEN_WIDTH//2, info_y))
-            SCREEN.blit(info_surface, info_rect)
-            info_y += 20
-        
-        # Steps section
-        steps_title = get_font(20).render("Step-by-Step Solution:", True, "Yellow")
-        steps_rect = steps_title.get_rect(center=(SCREEN_WIDTH//2, info_y + 20))
-        SCREEN.blit(steps_title, steps_rect)
-        
-        # Calculate scrolling
-        start_y = info_y + 50
-        line_height = 20
-        total_height = len(steps) * line_height
-        screen_height = SCREEN_HEIGHT - start_y - 100
-        max_scroll = max(0, total_height - screen_height)
+        for label in labels:
+            label.update(SCREEN)
         
-        # Display steps with scrolling
-        current_y = start_y - scroll_offset
-        for i, step in enumerate(steps):
+        # Display steps with scrolling - only the visible steps are formatted
+        first_visible = max(0, (scroll_offset - 30) // line_height)
+        current_y = start_y - scroll_offset + first_visible * line_height
+        for i in range(first_visible, len(steps)):
             if current_y > SCREEN_HEIGHT - 100:
                 break
             if current_y >= start_y - 30:
-                step_surface = get_font(12).render(f"{i+1}. {step}", True, "White")
+                step_surface = render_text(get_font(12), f"{i+1}. {steps[i]}", True, "White")
                 step_rect = step_surface.get_rect(center=(SCREEN_WIDTH//2, current_y))
                 SCREEN.blit(step_surface, step_rect)
             current_y += line_height
         
-        # Navigation buttons
-        button_y = SCREEN_HEIGHT - 80
-        
-        # Return to Save Options button (left)
-        RETURN_SAVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 - 150, button_y), 
-                                   text_input="RETURN TO SAVE", font=get_font(18), 
-                                   base_color="Orange", hovering_color="White")
-        
-        # Back to Menu button (right)
-        CONTINUE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2 + 150, button_y), 
-                                 text_input="CONTINUE", font=get_font(18), 
-                                 base_color="Green", hovering_color="White")
-        
-        buttons = [RETURN_SAVE_BUTTON, CONTINUE_BUTTON]
-        
         for button in buttons:
             button.changeColor(MOUSE_POS)
             button.update(SCREEN)
         
-        # Instructions
-        if max_scroll > 0:
-            nav_text = get_font(12).render("UP/DOWN: scroll | ESC: back to menu", True, "Orange")
-        else:
-            nav_text = get_font(12).render("ESC: back to menu", True, "Orange")
-        nav_rect = nav_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
-        SCREEN.blit(nav_text, nav_rect)
-        
         pygame.display.update()
         clock.tick(60)
         
@@ -379,7 +425,7 @@ def show_save_confirmation():
     while pygame.time.get_ticks() - start_time < 2000:  # Show for 2 seconds
         SCREEN.fill("black")
         
-        confirmation_text = get_font(25).render("Result saved successfully!", True, "Green")
+        confirmation_text = render_text(get_font(25), "Result saved successfully!", True, "Green")
         confirmation_rect = confirmation_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         SCREEN.blit(confirmation_text, confirmation_rect)
         
@@ -416,17 +462,17 @@ def show_result(result, result_type):
             result_lines = [result]
         
         # Display title
-        title_text = get_font(25).render(f"{result_type}:", True, "Green")
+        title_text = render_text(get_font(25), f"{result_type}:", True, "Green")
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 200))
         SCREEN.blit(title_text, title_rect)
         
         # Display result lines
         for i, line in enumerate(result_lines):
-            line_surface = get_font(20).render(line, True, "White")
+            line_surface = render_text(get_font(20), line, True, "White")
             line_rect = line_surface.get_rect(center=(SCREEN_WIDTH//2, 250 + i * 30))
             SCREEN.blit(line_surface, line_rect)
         
-        continue_text = get_font(20).render("Press any key to continue", True, "Yellow")
+        continue_text = render_text(get_font(20), "Press any key to continue", True, "Yellow")
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, 450))
         SCREEN.blit(continue_text, continue_rect)
         
@@ -443,7 +489,7 @@ def show_result(result, result_type):
                     sys.exit()
                 return
 
-def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encrypt_solution_func, decrypt_solution_func, screen, screen_width, screen_height, get_font_func, Button, get_text_input_func):
+def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encrypt_solution_func, decrypt_solution_func, screen, screen_width, screen_height, get_font_func, Button, get_text_input_func, crack_func=None, suggest_func=None):
     """Fully functional enhanced cipher operation menu with input fields and operations"""
     clock = pygame.time.Clock()
     time_counter = 0
@@ -458,6 +504,10 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
     # Input field states
     active_field = None
     
+    # Live dictionary suggestion, recomputed only when the input changes
+    suggested_for = ""
+    suggestion = None
+    
     while True:
         time_counter += 1
         MOUSE_POS = pygame.mouse.get_pos()
@@ -469,7 +519,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
         title_box = pygame.Rect(screen_width//2 - 300, 60, 600, 60)
         draw_glowing_rect(screen, title_box, (0, 0, 0, 180), (0, 255, 136), 2)
         
-        TITLE_TEXT = get_font_func(28).render(cipher_name.upper(), True, (255, 255, 255))
+        TITLE_TEXT = render_text(get_font_func(28), cipher_name.upper(), True, (255, 255, 255))
         TITLE_RECT = TITLE_TEXT.get_rect(center=(screen_width//2, 90))
         screen.blit(TITLE_TEXT, TITLE_RECT)
         
@@ -489,7 +539,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
                 draw_glowing_rect(screen, plaintext_header_rect, (0, 0, 0, 150), (255, 200, 0), 2)
         else:
             draw_glowing_rect(screen, plaintext_header_rect, (0, 0, 0, 150), (0, 255, 136), 2)
-        plaintext_text = get_font_func(14).render("PLAINTEXT:", True, (255, 255, 255))
+        plaintext_text = render_text(get_font_func(14), "PLAINTEXT:", True, (255, 255, 255))
         screen.blit(plaintext_text, (screen_width//2 - 410, header_y + 7))
         
         # Key header and input
@@ -501,7 +551,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
                 draw_glowing_rect(screen, key_header_rect, (0, 0, 0, 150), (255, 200, 0), 2)
         else:
             draw_glowing_rect(screen, key_header_rect, (0, 0, 0, 150), (0, 255, 136), 2)
-        key_text = get_font_func(14).render("KEY VALUE:", True, (255, 255, 255))
+        key_text = render_text(get_font_func(14), "KEY VALUE:", True, (255, 255, 255))
         screen.blit(key_text, (screen_width//2 - 120, header_y + 7))
         
         # Operation toggle button
@@ -511,7 +561,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
         else:
             draw_glowing_rect(screen, operation_rect, (192, 57, 43, 200), (231, 76, 60), 2)
         
-        operation_text = get_font_func(14).render(current_operation, True, (255, 255, 255))
+        operation_text = render_text(get_font_func(14), current_operation, True, (255, 255, 255))
         operation_text_rect = operation_text.get_rect(center=operation_rect.center)
         screen.blit(operation_text, operation_text_rect)
         
@@ -522,7 +572,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
         else:
             draw_glowing_rect(screen, submit_rect, (39, 174, 96), (46, 213, 115), 2)
         
-        submit_text = get_font_func(14).render("SUBMIT", True, (255, 255, 255))
+        submit_text = render_text(get_font_func(14), "SUBMIT", True, (255, 255, 255))
         submit_text_rect = submit_text.get_rect(center=submit_rect.center)
         screen.blit(submit_text, submit_text_rect)
         
@@ -534,23 +584,34 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
         display_y = 270
         
         # Plaintext display
-        plaintext_label = get_font_func(18).render("Plaintext:", True, (255, 200, 0))
+        plaintext_label = render_text(get_font_func(18), "Plaintext:", True, (255, 200, 0))
         screen.blit(plaintext_label, (screen_width//2 - 420, display_y))
-        plaintext_value = get_font_func(16).render(plaintext_input[:40] + ("..." if len(plaintext_input) > 40 else ""), True, (255, 255, 255))
+        plaintext_value = render_text(get_font_func(16), plaintext_input[:40] + ("..." if len(plaintext_input) > 40 else ""), True, (255, 255, 255))
         screen.blit(plaintext_value, (screen_width//2 - 230, display_y + 2))
         
         # Key display
-        key_label = get_font_func(18).render("Key:", True, (255, 200, 0))
+        key_label = render_text(get_font_func(18), "Key:", True, (255, 200, 0))
         screen.blit(key_label, (screen_width//2 - 420, display_y + 50))
-        key_value = get_font_func(16).render(str(key_input), True, (255, 255, 255))
+        key_value = render_text(get_font_func(16), str(key_input), True, (255, 255, 255))
         screen.blit(key_value, (screen_width//2 - 230, display_y + 52))
         
         # Result display
-        result_label = get_font_func(18).render("Result:", True, (100, 255, 200))
+        result_label = render_text(get_font_func(18), "Result:", True, (100, 255, 200))
         screen.blit(result_label, (screen_width//2 - 420, display_y + 100))
-        result_value = get_font_func(16).render(result_output[:40] + ("..." if len(result_output) > 40 else ""), True, (255, 255, 255))
+        result_value = render_text(get_font_func(16), result_output[:40] + ("..." if len(result_output) > 40 else ""), True, (255, 255, 255))
         screen.blit(result_value, (screen_width//2 - 230, display_y + 102))
         
+        # Live suggestion - the key that turns the most typed words into dictionary words
+        if suggest_func:
+            if plaintext_input != suggested_for:
+                suggested_for = plaintext_input
+                results = suggest_func(plaintext_input) if plaintext_input else []
+                suggestion = results[0] if results and results[0][1] else None
+            if suggestion:
+                key, _, guess = suggestion
+                suggestion_text = render_text(get_font_func(12), f"Suggestion: key {key} -> {guess[:45]}{'...' if len(guess) > 45 else ''}", True, (180, 180, 255))
+                screen.blit(suggestion_text, (screen_width//2 - 420, display_y + 145))
+        
         # Action buttons
         button_y = 470
         
@@ -560,7 +621,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
             draw_glowing_rect(screen, save_rect, (255, 255, 255), (200, 200, 200), 3)
         else:
             draw_glowing_rect(screen, save_rect, (240, 240, 240 ), (255, 255, 255), 2)
-        save_text = get_font_func(14).render("SAVE RESULT", True, (0, 0, 0 ))
+        save_text = render_text(get_font_func(14), "SAVE RESULT", True, (0, 0, 0 ))
         screen.blit(save_text, (screen_width//2 - 385, button_y + 15))
         
         # Continue button
@@ -569,7 +630,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
             draw_glowing_rect(screen, continue_rect, (231, 76, 60), (255, 120, 120), 3)
         else:
             draw_glowing_rect(screen, continue_rect, (192, 57, 43), (231, 76, 60), 2)
-        continue_text = get_font_func(14).render("CLEAR", True, (255, 255, 255))
+        continue_text = render_text(get_font_func(14), "CLEAR", True, (255, 255, 255))
         screen.blit(continue_text, (screen_width//2 - 155, button_y + 15))
         
         # Encrypt Steps button (blue)
@@ -578,7 +639,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
             draw_glowing_rect(screen, enc_steps_rect, (52, 152, 219), (100, 180, 255), 3)
         else:
             draw_glowing_rect(screen, enc_steps_rect, (41, 128, 185), (52, 152, 219), 2)
-        enc_steps_text = get_font_func(12).render("ENCRYPT STEPS", True, (255, 255, 255))
+        enc_steps_text = render_text(get_font_func(12), "ENCRYPT STEPS", True, (255, 255, 255))
         screen.blit(enc_steps_text, (screen_width//2 - 5, button_y + 15))
         
         # Decrypt Steps button (purple)
@@ -587,7 +648,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
             draw_glowing_rect(screen, dec_steps_rect, (155, 89, 182), (200, 150, 255), 3)
         else:
             draw_glowing_rect(screen, dec_steps_rect, (142, 68, 173), (155, 89, 182), 2)
-        dec_steps_text = get_font_func(12).render("DECRYPT STEPS", True, (255, 255, 255))
+        dec_steps_text = render_text(get_font_func(12), "DECRYPT STEPS", True, (255, 255, 255))
         screen.blit(dec_steps_text, (screen_width//2 + 195, button_y + 15))
         
         # Back button
@@ -596,12 +657,23 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
             draw_glowing_rect(screen, back_rect, (200, 200, 200), (255, 100, 100), 3)
         else:
             draw_glowing_rect(screen, back_rect, (100, 100, 100), (150, 150, 150), 2)
-        back_text = get_font_func(20).render("BACK", True, (255, 120, 120))
+        back_text = render_text(get_font_func(20), "BACK", True, (255, 120, 120))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         screen.blit(back_text, back_text_rect)
         
+        # Crack button (orange) - recovers the key of the text typed in PLAINTEXT
+        crack_rect = pygame.Rect(screen_width//2 + 180, button_y + 70, 180, 45)
+        if crack_func:
+            if crack_rect.collidepoint(MOUSE_POS):
+                draw_glowing_rect(screen, crack_rect, (230, 126, 34), (255, 190, 120), 3)
+            else:
+                draw_glowing_rect(screen, crack_rect, (211, 84, 0), (230, 126, 34), 2)
+            crack_text = render_text(get_font_func(14), "CRACK KEY", True, (255, 255, 255))
+            crack_text_rect = crack_text.get_rect(center=crack_rect.center)
+            screen.blit(crack_text, crack_text_rect)
+        
         # Instructions at bottom
-        instruction_text = get_font_func(12).render("Click on PLAINTEXT or KEY fields above to type. Press ESC to go back.", True, (150, 150, 150))
+        instruction_text = render_text(get_font_func(12), "Click on PLAINTEXT or KEY fields above to type. Press ESC to go back.", True, (150, 150, 150))
         instruction_rect = instruction_text.get_rect(center=(screen_width//2, screen_height - 30))
         screen.blit(instruction_text, instruction_rect)
         
@@ -646,7 +718,7 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
                 elif not (submit_rect.collidepoint(MOUSE_POS) or operation_rect.collidepoint(MOUSE_POS) or 
                          save_rect.collidepoint(MOUSE_POS) or continue_rect.collidepoint(MOUSE_POS) or
                          enc_steps_rect.collidepoint(MOUSE_POS) or dec_steps_rect.collidepoint(MOUSE_POS) or
-                         back_rect.collidepoint(MOUSE_POS)):
+                         back_rect.collidepoint(MOUSE_POS) or (crack_func and crack_rect.collidepoint(MOUSE_POS))):
                     active_field = None
                 
                 # Operation toggle
@@ -659,12 +731,24 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
                     play_click_sound()
                     if plaintext_input and key_input:
                         try:
+                            # Compute the cipher once; solution steps are formatted lazily
                             if current_operation == "ENCRYPTION":
-                                result_output = encrypt_func(plaintext_input, key_input)
-                                _, solutions_output = encrypt_solution_func(plaintext_input, key_input)
+                                result_output, solutions_output = encrypt_solution_func(plaintext_input, key_input)
                             else:
-                                result_output = decrypt_func(plaintext_input, key_input)
-                                _, solutions_output = decrypt_solution_func(plaintext_input, key_input)
+                                result_output, solutions_output = decrypt_solution_func(plaintext_input, key_input)
+                        except Exception as e:
+                            result_output = f"Error: {str(e)}"
+                            solutions_output = []
+                
+                # Crack button - treat the input as ciphertext and decrypt with the best key
+                if crack_func and crack_rect.collidepoint(MOUSE_POS):
+                    play_click_sound()
+                    if plaintext_input:
+                        try:
+                            best_key = crack_func(plaintext_input)[0][0]
+                            key_input = str(best_key)
+                            current_operation = "DECRYPTION"
+                            result_output, solutions_output = decrypt_solution_func(plaintext_input, key_input)
                         except Exception as e:
                             result_output = f"Error: {str(e)}"
                             solutions_output = []
@@ -727,23 +811,26 @@ def enhanced_cipher_operation_menu(cipher_name, encrypt_func, decrypt_func, encr
 def show_operation_selection():
     """Show encrypt/decrypt selection for show solution"""
     clock = pygame.time.Clock()
+    
+    TITLE_TEXT = Label((SCREEN_WIDTH//2, 200), "SELECT OPERATION", get_font(30), "White")
+    
+    ENCRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
+                           text_input="ENCRYPT", font=get_font(40), base_color="Green", hovering_color="White")
+    DECRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 380), 
+                           text_input="DECRYPT", font=get_font(40), base_color="Red", hovering_color="White")
+    BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
+                        text_input="BACK", font=get_font(40), base_color="Gray", hovering_color="White")
+    
+    buttons = [ENCRYPT_BUTTON, DECRYPT_BUTTON, BACK_BUTTON]
+    
     while True:
         MOUSE_POS = pygame.mouse.get_pos()
         
         SCREEN.fill("black")
         
-        TITLE_TEXT = get_font(30).render("SELECT OPERATION", True, "White")
-        TITLE_RECT = TITLE_TEXT.get_rect(center=(SCREEN_WIDTH//2, 200))
-        SCREEN.blit(TITLE_TEXT, TITLE_RECT)
-        
-        ENCRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
-                               text_input="ENCRYPT", font=get_font(40), base_color="Green", hovering_color="White")
-        DECRYPT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 380), 
-                               text_input="DECRYPT", font=get_font(40), base_color="Red", hovering_color="White")
-        BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
-                            text_input="BACK", font=get_font(40), base_color="Gray", hovering_color="White")
+        TITLE_TEXT.update(SCREEN)
         
-        for button in [ENCRYPT_BUTTON, DECRYPT_BUTTON, BACK_BUTTON]:
+        for button in buttons:
             button.changeColor(MOUSE_POS)
             button.update(SCREEN)
         
@@ -781,7 +868,9 @@ def additive_cipher_screen():
         SCREEN_HEIGHT,
         get_font,
         Button,
-        None
+        None,
+        crack_func=rank_additive_keys,
+        suggest_func=suggest_keys
     )
 
 def autokey_cipher_screen():
@@ -796,7 +885,8 @@ def autokey_cipher_screen():
         SCREEN_HEIGHT,
         get_font,
         Button,
-        None
+        None,
+        crack_func=rank_autokey_keys
     )
 
 def vigenere_cipher_screen():
@@ -822,47 +912,49 @@ def cipher_game_screen():
 def about_screen():
     """Information about the cipher methods"""
     clock = pygame.time.Clock()
+    
+    TITLE_TEXT = Label((SCREEN_WIDTH//2, 80), "ABOUT CIPHERS", get_font(35), "White")
+    
+    info_lines = [
+        "ADDITIVE CIPHER: Shifts each letter by a fixed number (Monoalphabetic)",
+        "AUTO-KEY CIPHER: Uses the message itself as part of the key (Polyalphabetic)",
+        "VIGENÈRE CIPHER: Uses a repeating keyword to encrypt (Polyalphabetic)",
+        "",
+        "All ciphers work with alphabetic characters only.",
+        "Numbers and symbols are preserved unchanged.",
+        "",
+        "FEATURES:",
+        "• Use 'SHOW SOLUTION' to see step-by-step process!",
+        "• Save your cipher results for future reference!",
+        "• View all saved results in CIPHER HISTORY!",
+        "• Play the interactive CIPHER GAME!",
+        "• Quick automation buttons for seamless operations!"
+    ]
+    
+    labels = []
+    for i, line in enumerate(info_lines):
+        if "FEATURES:" in line:
+            color = "Orange"
+        elif line.startswith("•"):
+            color = "Cyan"
+        elif "Monoalphabetic" in line or "Polyalphabetic" in line:
+            color = "Yellow"
+        else:
+            color = "White"
+        labels.append(Label((SCREEN_WIDTH//2, 140 + i * 25), line, get_font(18), color))
+    
+    BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
+                        text_input="BACK", font=get_font(50), base_color="White", hovering_color="Red")
+    
     while True:
         MOUSE_POS = pygame.mouse.get_pos()
         
         SCREEN.fill("black")
         
-        TITLE_TEXT = get_font(35).render("ABOUT CIPHERS", True, "White")
-        TITLE_RECT = TITLE_TEXT.get_rect(center=(SCREEN_WIDTH//2, 80))
-        SCREEN.blit(TITLE_TEXT, TITLE_RECT)
-        
-        info_lines = [
-            "ADDITIVE CIPHER: Shifts each letter by a fixed number (Monoalphabetic)",
-            "AUTO-KEY CIPHER: Uses the message itself as part of the key (Polyalphabetic)",
-            "VIGENÈRE CIPHER: Uses a repeating keyword to encrypt (Polyalphabetic)",
-            "",
-            "All ciphers work with alphabetic characters only.",
-            "Numbers and symbols are preserved unchanged.",
-            "",
-            "FEATURES:",
-            "• Use 'SHOW SOLUTION' to see step-by-step process!",
-            "• Save your cipher results for future reference!",
-            "• View all saved results in CIPHER HISTORY!",
-            "• Play the interactive CIPHER GAME!",
-            "• Quick automation buttons for seamless operations!"
-        ]
-        
-        for i, line in enumerate(info_lines):
-            if "FEATURES:" in line:
-                color = "Orange"
-            elif line.startswith("•"):
-                color = "Cyan"
-            elif "Monoalphabetic" in line or "Polyalphabetic" in line:
-                color = "Yellow"
-            else:
-                color = "White"
-            
-            text_surface = get_font(18).render(line, True, color)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH//2, 140 + i * 25))
-            SCREEN.blit(text_surface, text_rect)
+        TITLE_TEXT.update(SCREEN)
         
-        BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
-                            text_input="BACK", font=get_font(50), base_color="White", hovering_color="Red")
+        for label in labels:
+            label.update(SCREEN)
         
         BACK_BUTTON.changeColor(MOUSE_POS)
         BACK_BUTTON.update(SCREEN)
@@ -894,6 +986,24 @@ def options():
         background_image = None
         print("Options background image not found, using fallback color")
     
+    OPTIONS_TEXT = Label((SCREEN_WIDTH//2, 100), "SELECT A CIPHER TYPE", get_font(30), "Blue")
+
+    # Centered buttons with proper spacing
+    ADDITIVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 180), 
+                    text_input="ADDITIVE CIPHER (MONOALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
+    AUTOKEY_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 240), 
+                            text_input="AUTO-KEY CIPHER (POLYALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
+    VIGENERE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
+                            text_input="VIGENÈRE CIPHER (POLYALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
+    ABOUT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 380), 
+                            text_input="ABOUT CIPHER", font=get_font(35), base_color="Yellow", hovering_color="Orange")
+    HISTORY_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 450), 
+                            text_input="CIPHER HISTORY", font=get_font(35), base_color="Yellow", hovering_color="Orange")
+    BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 520), 
+                            text_input="BACK", font=get_font(50), base_color="White", hovering_color="Red")
+    
+    buttons = [ADDITIVE_BUTTON, AUTOKEY_BUTTON, VIGENERE_BUTTON, ABOUT_BUTTON, HISTORY_BUTTON, BACK_BUTTON]
+
     while True:
         OPTIONS_MOUSE_POS = pygame.mouse.get_pos()
 
@@ -903,25 +1013,7 @@ def options():
         else:
             SCREEN.fill("white")
 
-        OPTIONS_TEXT = get_font(30).render("SELECT A CIPHER TYPE", True, "Blue")
-        OPTIONS_RECT = OPTIONS_TEXT.get_rect(center=(SCREEN_WIDTH//2, 100))
-        SCREEN.blit(OPTIONS_TEXT, OPTIONS_RECT)
-
-        # Centered buttons with proper spacing
-        ADDITIVE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 180), 
-                        text_input="ADDITIVE CIPHER (MONOALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
-        AUTOKEY_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 240), 
-                                text_input="AUTO-KEY CIPHER (POLYALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
-        VIGENERE_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
-                                text_input="VIGENÈRE CIPHER (POLYALPHABETIC)", font=get_font(30), base_color="White", hovering_color="Blue")
-        ABOUT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 380), 
-                                text_input="ABOUT CIPHER", font=get_font(35), base_color="Yellow", hovering_color="Orange")
-        HISTORY_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 450), 
-                                text_input="CIPHER HISTORY", font=get_font(35), base_color="Yellow", hovering_color="Orange")
-        BACK_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 520), 
-                                text_input="BACK", font=get_font(50), base_color="White", hovering_color="Red")
-        
-        buttons = [ADDITIVE_BUTTON, AUTOKEY_BUTTON, VIGENERE_BUTTON, ABOUT_BUTTON, HISTORY_BUTTON, BACK_BUTTON]
+        OPTIONS_TEXT.update(SCREEN)
         
         for button in buttons:
             button.changeColor(OPTIONS_MOUSE_POS)
@@ -969,6 +1061,17 @@ def main_menu():
         background_image = None
         print("Background image not found, using fallback color")
     
+    MENU_TEXT = Label((SCREEN_WIDTH//2, 150), "WELCOME TO", get_font(50), "#b68f40")
+    MENU_TEXT2 = Label((SCREEN_WIDTH//2, 200), "CIPHER WORLD", get_font(50), "#b68f40")
+
+    # Centered buttons with proper spacing
+    CIPHERS_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
+                        text_input="CIPHER GAME", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
+    ABOUT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 400), 
+                        text_input="LEARN CIPHER", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
+    QUIT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
+                        text_input="QUIT", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
+
     while True:
         # Use background image instead of fill color
         if background_image:
@@ -978,21 +1081,8 @@ def main_menu():
 
         MENU_MOUSE_POS = pygame.mouse.get_pos()
 
-        MENU_TEXT = get_font(50).render("WELCOME TO", True, "#b68f40")
-        MENU_TEXT2 = get_font(50).render("CIPHER WORLD", True, "#b68f40")
-        MENU_RECT = MENU_TEXT.get_rect(center=(SCREEN_WIDTH//2, 150))
-        MENU_RECT2 = MENU_TEXT2.get_rect(center=(SCREEN_WIDTH//2, 200))
-
-        # Centered buttons with proper spacing
-        CIPHERS_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 300), 
-                            text_input="CIPHER GAME", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
-        ABOUT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 400), 
-                            text_input="LEARN CIPHER", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
-        QUIT_BUTTON = Button(image=None, pos=(SCREEN_WIDTH//2, 500), 
-                            text_input="QUIT", font=get_font(60), base_color="#ffee00ff", hovering_color="White")
-
-        SCREEN.blit(MENU_TEXT, MENU_RECT)
-        SCREEN.blit(MENU_TEXT2, MENU_RECT2)
+        MENU_TEXT.update(SCREEN)
+        MENU_TEXT2.update(SCREEN)
 
         for button in [CIPHERS_BUTTON, ABOUT_BUTTON, QUIT_BUTTON]:
             button.changeColor(MENU_MOUSE_POS)
@@ -1043,7 +1133,7 @@ def delete_entry_confirmation(entry_index, entry_data):
         SCREEN.fill("black")
         
         # Confirmation title
-        title_text = get_font(24).render("CONFIRM DELETE", True, "Red")
+        title_text = render_text(get_font(24), "CONFIRM DELETE", True, "Red")
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 150))
         SCREEN.blit(title_text, title_rect)
         
@@ -1058,12 +1148,12 @@ def delete_entry_confirmation(entry_index, entry_data):
         
         y_pos = 200
         for text in preview_text:
-            surface = get_font(14).render(text, True, "Yellow")
+            surface = render_text(get_font(14), text, True, "Yellow")
             rect = surface.get_rect(center=(SCREEN_WIDTH//2, y_pos))
             SCREEN.blit(surface, rect)
             y_pos += 25
         
-        warning_text = get_font(16).render("This action cannot be undone!", True, "Red")
+        warning_text = render_text(get_font(16), "This action cannot be undone!", True, "Red")
         warning_rect = warning_text.get_rect(center=(SCREEN_WIDTH//2, y_pos + 20))
         SCREEN.blit(warning_text, warning_rect)
         
@@ -1076,8 +1166,8 @@ def delete_entry_confirmation(entry_index, entry_data):
         pygame.draw.rect(SCREEN, "Red", confirm_btn, 2)
         pygame.draw.rect(SCREEN, "Green", cancel_btn, 2)
         
-        confirm_text = get_font(16).render("DELETE", True, "White")
-        cancel_text = get_font(16).render("CANCEL", True, "White")
+        confirm_text = render_text(get_font(16), "DELETE", True, "White")
+        cancel_text = render_text(get_font(16), "CANCEL", True, "White")
         
         confirm_rect = confirm_text.get_rect(center=confirm_btn.center)
         cancel_rect = cancel_text.get_rect(center=cancel_btn.center)
@@ -1086,7 +1176,7 @@ def delete_entry_confirmation(entry_index, entry_data):
         SCREEN.blit(cancel_text, cancel_rect)
         
         # Instructions
-        inst_text = get_font(14).render("Click DELETE to confirm, CANCEL to abort, or ESC to cancel", True, "Orange")
+        inst_text = render_text(get_font(14), "Click DELETE to confirm, CANCEL to abort, or ESC to cancel", True, "Orange")
         inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
         SCREEN.blit(inst_text, inst_rect)
         
@@ -1131,13 +1221,13 @@ def show_cipher_history():
         # Title with delete mode indicator
         title_color = "Red" if delete_mode else "Green"
         title_prefix = "DELETE MODE - " if delete_mode else ""
-        title_text = get_font(30).render(f"{title_prefix}CIPHER HISTORY", True, title_color)
+        title_text = render_text(get_font(30), f"{title_prefix}CIPHER HISTORY", True, title_color)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 30))
         SCREEN.blit(title_text, title_rect)
         
         # Search bar (only show if more than 10 entries)
         if len(cipher_history) >= 10:
-            search_label = get_font(16).render("Search:", True, "Yellow")
+            search_label = render_text(get_font(16), "Search:", True, "Yellow")
             SCREEN.blit(search_label, (50, 70))
             
             # Search input box
@@ -1146,11 +1236,11 @@ def show_cipher_history():
             pygame.draw.rect(SCREEN, "Black", search_box)
             pygame.draw.rect(SCREEN, search_color, search_box, 2)
             
-            search_surface = get_font(16).render(search_text + ("_" if search_active else ""), True, "White")
+            search_surface = render_text(get_font(16), search_text + ("_" if search_active else ""), True, "White")
             SCREEN.blit(search_surface, (search_box.x + 5, search_box.y + 3))
             
             # Filter buttons
-            filter_label = get_font(16).render("Filter:", True, "Yellow")
+            filter_label = render_text(get_font(16), "Filter:", True, "Yellow")
             SCREEN.blit(filter_label, (450, 70))
             
             # Filter operation buttons
@@ -1166,9 +1256,9 @@ def show_cipher_history():
             pygame.draw.rect(SCREEN, enc_color, enc_btn)
             pygame.draw.rect(SCREEN, dec_color, dec_btn)
             
-            all_text = get_font(12).render("ALL", True, "White")
-            enc_text = get_font(12).render("ENCRYPT", True, "White")
-            dec_text = get_font(12).render("DECRYPT", True, "White")
+            all_text = render_text(get_font(12), "ALL", True, "White")
+            enc_text = render_text(get_font(12), "ENCRYPT", True, "White")
+            dec_text = render_text(get_font(12), "DECRYPT", True, "White")
             
             SCREEN.blit(all_text, (all_btn.x + 18, all_btn.y + 6))
             SCREEN.blit(enc_text, (enc_btn.x + 15, enc_btn.y + 6))
@@ -1179,7 +1269,7 @@ def show_cipher_history():
             start_y = 80
         
         # Results count and delete mode toggle
-        count_text = get_font(16).render(f"Results: {len(filtered_history)}/{len(cipher_history)}", True, "Cyan")
+        count_text = render_text(get_font(16), f"Results: {len(filtered_history)}/{len(cipher_history)}", True, "Cyan")
         count_rect = count_text.get_rect(center=(SCREEN_WIDTH//2 - 100, start_y))
         SCREEN.blit(count_text, count_rect)
         
@@ -1191,7 +1281,7 @@ def show_cipher_history():
         pygame.draw.rect(SCREEN, delete_btn_color, delete_btn)
         pygame.draw.rect(SCREEN, "White", delete_btn, 1)
         
-        delete_text = get_font(12).render(delete_btn_text, True, "White")
+        delete_text = render_text(get_font(12), delete_btn_text, True, "White")
         delete_text_rect = delete_text.get_rect(center=delete_btn.center)
         SCREEN.blit(delete_text, delete_text_rect)
         
@@ -1226,13 +1316,13 @@ def show_cipher_history():
                 pygame.draw.rect(SCREEN, "DarkRed", delete_entry_btn)
                 pygame.draw.rect(SCREEN, "Red", delete_entry_btn, 1)
                 
-                del_text = get_font(10).render("DELETE", True, "White")
+                del_text = render_text(get_font(10), "DELETE", True, "White")
                 del_text_rect = del_text.get_rect(center=delete_entry_btn.center)
                 SCREEN.blit(del_text, del_text_rect)
                 
                 entry_buttons.append((delete_entry_btn, original_index, entry))
             
-            separator = get_font(16).render(separator_text, True, operation_color)
+            separator = render_text(get_font(16), separator_text, True, operation_color)
             separator_rect = separator.get_rect(center=(SCREEN_WIDTH//2, current_y))
             SCREEN.blit(separator, separator_rect)
             current_y += line_height
@@ -1250,7 +1340,7 @@ def show_cipher_history():
             for detail in details:
                 if detail and current_y < SCREEN_HEIGHT and current_y > start_y - 50:
                     color = "Orange" if detail.startswith(("Date:", "Cipher:")) else "White"
-                    detail_surface = get_font(12).render(detail, True, color)
+                    detail_surface = render_text(get_font(12), detail, True, color)
                     detail_rect = detail_surface.get_rect(center=(SCREEN_WIDTH//2, current_y))
                     SCREEN.blit(detail_surface, detail_rect)
                 current_y += line_height
@@ -1259,19 +1349,19 @@ def show_cipher_history():
         if len(cipher_history) >= 10:
             if max_scroll > 0:
                 if delete_mode:
-                    nav_text = get_font(14).render("UP/DOWN: scroll | Click DELETE buttons to remove entries | ESC: back", True, "Orange")
+                    nav_text = render_text(get_font(14), "UP/DOWN: scroll | Click DELETE buttons to remove entries | ESC: back", True, "Orange")
                 else:
-                    nav_text = get_font(14).render("UP/DOWN: scroll | Click search box to search | D: delete mode | ESC: back", True, "Orange")
+                    nav_text = render_text(get_font(14), "UP/DOWN: scroll | Click search box to search | D: delete mode | ESC: back", True, "Orange")
             else:
                 if delete_mode:
-                    nav_text = get_font(14).render("Click DELETE buttons to remove entries | ESC: back", True, "Orange")
+                    nav_text = render_text(get_font(14), "Click DELETE buttons to remove entries | ESC: back", True, "Orange")
                 else:
-                    nav_text = get_font(14).render("Click search box to search | D: delete mode | ESC: back", True, "Orange")
+                    nav_text = render_text(get_font(14), "Click search box to search | D: delete mode | ESC: back", True, "Orange")
         else:
             if delete_mode:
-                nav_text = get_font(14).render("Click DELETE buttons to remove entries | D: exit delete mode | ESC: back", True, "Orange")
+                nav_text = render_text(get_font(14), "Click DELETE buttons to remove entries | D: exit delete mode | ESC: back", True, "Orange")
             else:
-                nav_text = get_font(14).render("D: delete mode | ESC: back to main menu", True, "Orange")
+                nav_text = render_text(get_font(14), "D: delete mode | ESC: back to main menu", True, "Orange")
         
         nav_rect = nav_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
         SCREEN.blit(nav_text, nav_rect)
@@ -1352,15 +1442,15 @@ def show_no_history():
     while True:
         SCREEN.fill("black")
         
-        no_history_text = get_font(25).render("No cipher history found!", True, "Red")
+        no_history_text = render_text(get_font(25), "No cipher history found!", True, "Red")
         no_history_rect = no_history_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
         SCREEN.blit(no_history_text, no_history_rect)
         
-        instruction_text = get_font(20).render("Use ciphers and save results to build history", True, "Yellow")
+        instruction_text = render_text(get_font(20), "Use ciphers and save results to build history", True, "Yellow")
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         SCREEN.blit(instruction_text, instruction_rect)
         
-        continue_text = get_font(20).render("Press any key to go back", True, "White")
+        continue_text = render_text(get_font(20), "Press any key to go back", True, "White")
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
         SCREEN.blit(continue_text, continue_rect)
         
@@ -1377,68 +1467,48 @@ def show_no_history():
 # Enhanced Additive Cipher Functions with solution tracking
 def additive_encrypt_decrypt_with_solution(text, mode, key):
     letters = 'abcdefghijklmnopqrstuvwxyz'
-    result = ''
-    solution_steps = []
-    
-    # Convert key to number if it's a letter
-    if isinstance(key, str) and len(key) == 1 and key.isalpha():
-        key = letters.find(key.lower())
-        if key == -1:  # Letter not found
-            key = 0
-    else:
-        key = int(key)  # Ensure key is an integer
-    
-    solution_steps.append(f"Key: {key}")
-    solution_steps.append(f"Mode: {'Encryption' if mode == 'e' else 'Decryption'}")
-    solution_steps.append(f"{'Encryption' if mode == 'e' else 'Decryption'} Process:")
     
+    # Convert key to number if it's a letter, then translate the whole text at once
+    key = parse_additive_key(key)
+    result = additive_translate(text, mode, key)
     actual_key = key if mode == 'e' else -key
     
-    for i, letter in enumerate(text):
-        original_letter = letter
-        letter = letter.lower()
-        
-        if letter in letters:
-            index = letters.find(letter)
-            new_index_raw = index + actual_key
-            new_index = new_index_raw % len(letters)
-            new_letter = letters[new_index]
-            result += new_letter
-            
-            # Create step explanation
-            if mode == 'e':
-                if new_index_raw >= 26:
-                    step = f"{original_letter.upper()} ({index}) + {key} = {new_index_raw} = ({new_index_raw}-26) = {new_index} -> {new_letter.upper()}"
-                else:
-                    step = f"{original_letter.upper()} ({index}) + {key} = {new_index} -> {new_letter.upper()}"
-            else:
-                if new_index_raw < 0:
-                    step = f"{original_letter.upper()} ({index}) - {key} = {new_index_raw} = ({new_index_raw}+26) = {new_index} -> {new_letter.upper()}"
-                else:
-                    step = f"{original_letter.upper()} ({index}) - {key} = {new_index} -> {new_letter.upper()}"
-            
-            solution_steps.append(step)
-        else:
-            result += letter
-            solution_steps.append(f"{original_letter} (non-alphabetic) -> {original_letter}")
+    def step(i):
+        original_letter = text[i]
+        letter = original_letter.lower()
+        if letter not in letters:
+            return f"{original_letter} (non-alphabetic) -> {original_letter}"
+        
+        index = letters.find(letter)
+        new_index_raw = index + actual_key
+        new_index = new_index_raw % len(letters)
+        new_letter = letters[new_index]
+        
+        # Create step explanation
+        if mode == 'e':
+            if new_index_raw >= 26:
+                return f"{original_letter.upper()} ({index}) + {key} = {new_index_raw} = ({new_index_raw}-26) = {new_index} -> {new_letter.upper()}"
+            return f"{original_letter.upper()} ({index}) + {key} = {new_index} -> {new_letter.upper()}"
+        if new_index_raw < 0:
+            return f"{original_letter.upper()} ({index}) - {key} = {new_index_raw} = ({new_index_raw}+26) = {new_index} -> {new_letter.upper()}"
+        return f"{original_letter.upper()} ({index}) - {key} = {new_index} -> {new_letter.upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Key: {key}",
+        f"Mode: {'Encryption' if mode == 'e' else 'Decryption'}",
+        f"{'Encryption' if mode == 'e' else 'Decryption'} Process:"
+    ], len(text), step)
     
     return result, solution_steps
 
 def additive_encrypt_decrypt(text, mode, key):
-    result, _ = additive_encrypt_decrypt_with_solution(text, mode, key)
-    return result
+    return additive_translate(text, mode, key)
 
 # Enhanced Auto-Key Cipher Functions with solution tracking
 def generate_autokey(plaintext, key):
     """Generate autokey by prepending the numeric key and using plaintext values"""
-    # Convert key to numeric if it's a string
-    if isinstance(key, str):
-        try:
-            key_val = int(key)
-        except ValueError:
-            key_val = ord(key.upper()) - ord('A')
-    else:
-        key_val = key
+    # Convert key to numeric if it's a string (parsed keys are cached)
+    key_val = parse_autokey_key(key)
     
     # Start with the initial key value
     extended_key = [key_val]
@@ -1453,135 +1523,117 @@ def generate_autokey(plaintext, key):
 
 def autokey_encrypt_with_solution(plaintext, key):
     plaintext = plaintext.upper().replace(' ', '')
-    extended_key = generate_autokey(plaintext, key)
-    ciphertext = ''
-    solution_steps = []
-    
-    solution_steps.append(f"Original Key: {key}")
-    solution_steps.append(f"Plaintext Values: {[ord(c) - ord('A') for c in plaintext if c.isalpha()]}")
-    solution_steps.append(f"Extended Key: {extended_key}")
-    solution_steps.append("Encryption Process:")
-    
-    for i, p in enumerate(plaintext):
-        if p.isalpha():
-            p_val = ord(p) - ord('A')
-            k_val = extended_key[i]
-            c_val = (p_val + k_val) % 26
-            c = chr(c_val + ord('A'))
-            ciphertext += c
-            
-            step = f"{p} ({p_val}) + {k_val} = {c_val} -> {c}"
-            solution_steps.append(step)
-        else:
-            ciphertext += p
-            solution_steps.append(f"{p} (non-alphabetic) -> {p}")
+    ciphertext = autokey_encrypt_fast(plaintext, key)
+    
+    # The extended key is only needed once a step is displayed
+    extended_key = []
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_autokey(plaintext, key))
+        return extended_key
+    
+    def step(i):
+        p = plaintext[i]
+        if not p.isalpha():
+            return f"{p} (non-alphabetic) -> {p}"
+        p_val = ord(p) - ord('A')
+        k_val = get_extended_key()[i]
+        c_val = (p_val + k_val) % 26
+        return f"{p} ({p_val}) + {k_val} = {c_val} -> {ciphertext[i]}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key}",
+        lambda: f"Plaintext Values: {[ord(c) - ord('A') for c in plaintext if c.isalpha()]}",
+        lambda: f"Extended Key: {get_extended_key()}",
+        "Encryption Process:"
+    ], len(plaintext), step)
     
     return ciphertext, solution_steps
 
 def autokey_decrypt_with_solution(ciphertext, key):
     ciphertext = ciphertext.upper().replace(' ', '')
     
-    # Convert key to numeric if it's a string
-    if isinstance(key, str):
-        try:
-            key_val = int(key)
-        except ValueError:
-            key_val = ord(key.upper()) - ord('A')
-    else:
-        key_val = key
+    # Convert key to numeric if it's a string (parsed keys are cached)
+    key_val = parse_autokey_key(key)
     
-    plaintext = ''
-    solution_steps = []
+    # First character uses the initial key, the rest use the previous plaintext character
+    plaintext = autokey_decrypt_fast(ciphertext, key_val)
     
-    solution_steps.append(f"Original Key: {key}")
-    solution_steps.append("Decryption Process:")
+    def step(i):
+        c = ciphertext[i]
+        if not c.isalpha():
+            return f"{c} (non-alphabetic) -> {c}"
+        c_val = ord(c) - ord('A')
+        k_val = key_val if i == 0 else ord(plaintext[i-1]) - ord('A')
+        p_val = (c_val - k_val) % 26
+        return f"{c} ({c_val}) - {k_val} = {p_val} -> {plaintext[i]}"
     
-    for i, c in enumerate(ciphertext):
-        if c.isalpha():
-            c_val = ord(c) - ord('A')
-            
-            # First character uses the initial key
-            if i == 0:
-                k_val = key_val
-            else:
-                # Use the previous plaintext character
-                k_val = ord(plaintext[i-1]) - ord('A')
-            
-            p_val = (c_val - k_val) % 26
-            p = chr(p_val + ord('A'))
-            plaintext += p
-            
-            step = f"{c} ({c_val}) - {k_val} = {p_val} -> {p}"
-            solution_steps.append(step)
-        else:
-            plaintext += c
-            solution_steps.append(f"{c} (non-alphabetic) -> {c}")
+    solution_steps = SolutionSteps([
+        f"Original Key: {key}",
+        "Decryption Process:"
+    ], len(ciphertext), step)
     
     return plaintext, solution_steps
 
 def autokey_encrypt(plaintext, key):
-    result, _ = autokey_encrypt_with_solution(plaintext, key)
-    return result
+    return autokey_encrypt_fast(plaintext, key)
 
 def autokey_decrypt(ciphertext, key):
-    result, _ = autokey_decrypt_with_solution(ciphertext, key)
-    return result
+    return autokey_decrypt_fast(ciphertext, key)
 
 # Enhanced Vigenere Cipher Functions with solution tracking
+def generate_vigenere_key(text, key_values):
+    """Key value under every character of a lowercased text, None for non-letters"""
+    extended_key = []
+    key_index = 0
+    for letter in text:
+        if 'a' <= letter <= 'z':
+            extended_key.append(key_values[key_index % len(key_values)])
+            key_index += 1
+        else:
+            extended_key.append(None)
+    return extended_key
+
 def vigenere_encrypt_with_solution(message, key):
     letters = 'abcdefghijklmnopqrstuvwxyz'
     letter_to_index = dict(zip(letters, range(len(letters))))
     index_to_letter = dict(zip(range(len(letters)), letters))
     
-    encrypted = ''
     message = message.lower()
-    solution_steps = []
     
-    # Parse key - handle both numeric and letter keys
-    if isinstance(key, str) and ',' in key:
-        try:
-            key_values = [int(k.strip()) for k in key.split(',') if k.strip() != '']
-        except ValueError:
-            return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
-    elif isinstance(key, list):
-        key_values = key
-    else:
-        key = key.lower()
-        key_values = [letter_to_index[k] for k in key if k in letters]
+    # Parse key - handle both numeric and letter keys (parsed keys are cached)
+    try:
+        key_values = parse_vigenere_key(key)
+    except ValueError:
+        return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
     
     # Validate key
     if not key_values or len(key_values) == 0:
         return "Error: Empty or invalid key", ["Error: Please provide a valid key (either letters or numbers like '0, 5, 8')"]
     
-    # Create extended key
+    # The extended key is only needed once a step is displayed
     extended_key = []
-    key_index = 0
-    for letter in message:
-        if letter in letters:
-            extended_key.append(key_values[key_index % len(key_values)])
-            key_index += 1
-        else:
-            extended_key.append(None)
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_vigenere_key(message, key_values))
+        return extended_key
     
-    solution_steps.append(f"Original Key: {key_values}")
-    solution_steps.append(f"Extended Key: {[k if k is not None else '_' for k in extended_key]}")
-    solution_steps.append("Encryption Process:")
+    encrypted = vigenere_translate(message, key_values, 'e')
     
-    key_index = 0
-    for i, letter in enumerate(message):
-        if letter in letters:
-            key_val = key_values[key_index % len(key_values)]
-            letter_val = letter_to_index[letter]
-            encrypted_val = (letter_val + key_val) % len(letters)
-            encrypted_letter = index_to_letter[encrypted_val]
-            encrypted += encrypted_letter
-            
-            step = f"{letter.upper()} ({letter_val}) + {key_val} = {encrypted_val} -> {encrypted_letter.upper()}"
-            solution_steps.append(step)
-            key_index += 1
-        else:
-            encrypted += letter
-            solution_steps.append(f"{letter} (non-alphabetic) -> {letter}")
+    def step(i):
+        letter = message[i]
+        key_val = get_extended_key()[i]
+        if key_val is None:
+            return f"{letter} (non-alphabetic) -> {letter}"
+        letter_val = letter_to_index[letter]
+        encrypted_val = (letter_val + key_val) % len(letters)
+        return f"{letter.upper()} ({letter_val}) + {key_val} = {encrypted_val} -> {index_to_letter[encrypted_val].upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key_values}",
+        lambda: f"Extended Key: {[k if k is not None else '_' for k in get_extended_key()]}",
+        "Encryption Process:"
+    ], len(message), step)
     
     return encrypted, solution_steps
 
@@ -1590,65 +1642,49 @@ def vigenere_decrypt_with_solution(cipher, key):
     letter_to_index = dict(zip(letters, range(len(letters))))
     index_to_letter = dict(zip(range(len(letters)), letters))
     
-    decrypted = ''
     cipher = cipher.lower()
-    solution_steps = []
     
-    # Parse key - handle both numeric and letter keys
-    if isinstance(key, str) and ',' in key:
-        try:
-            key_values = [int(k.strip()) for k in key.split(',') if k.strip() != '']
-        except ValueError:
-            return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
-    elif isinstance(key, list):
-        key_values = key
-    else:
-        key = key.lower()
-        key_values = [letter_to_index[k] for k in key if k in letters]
+    # Parse key - handle both numeric and letter keys (parsed keys are cached)
+    try:
+        key_values = parse_vigenere_key(key)
+    except ValueError:
+        return "Error: Invalid numeric key format", ["Error: Key must contain valid numbers separated by commas"]
     
     # Validate key
     if not key_values or len(key_values) == 0:
         return "Error: Empty or invalid key", ["Error: Please provide a valid key (either letters or numbers like '0, 5, 8')"]
     
-    # Create extended key
+    # The extended key is only needed once a step is displayed
     extended_key = []
-    key_index = 0
-    for letter in cipher:
-        if letter in letters:
-            extended_key.append(key_values[key_index % len(key_values)])
-            key_index += 1
-        else:
-            extended_key.append(None)
+    def get_extended_key():
+        if not extended_key:
+            extended_key.extend(generate_vigenere_key(cipher, key_values))
+        return extended_key
     
-    solution_steps.append(f"Original Key: {key_values}")
-    solution_steps.append(f"Extended Key: {[k if k is not None else '_' for k in extended_key]}")
-    solution_steps.append("Decryption Process:")
+    decrypted = vigenere_translate(cipher, key_values, 'd')
     
-    key_index = 0
-    for letter in cipher:
-        if letter in letters:
-            key_val = key_values[key_index % len(key_values)]
-            cipher_val = letter_to_index[letter]
-            decrypted_val = (cipher_val - key_val) % len(letters)
-            decrypted_letter = index_to_letter[decrypted_val]
-            decrypted += decrypted_letter
-            
-            step = f"{letter.upper()} ({cipher_val}) - {key_val} = {decrypted_val} -> {decrypted_letter.upper()}"
-            solution_steps.append(step)
-            key_index += 1
-        else:
-            decrypted += letter
-            solution_steps.append(f"{letter} (non-alphabetic) -> {letter}")
+    def step(i):
+        letter = cipher[i]
+        key_val = get_extended_key()[i]
+        if key_val is None:
+            return f"{letter} (non-alphabetic) -> {letter}"
+        cipher_val = letter_to_index[letter]
+        decrypted_val = (cipher_val - key_val) % len(letters)
+        return f"{letter.upper()} ({cipher_val}) - {key_val} = {decrypted_val} -> {index_to_letter[decrypted_val].upper()}"
+    
+    solution_steps = SolutionSteps([
+        f"Original Key: {key_values}",
+        lambda: f"Extended Key: {[k if k is not None else '_' for k in get_extended_key()]}",
+        "Decryption Process:"
+    ], len(cipher), step)
     
     return decrypted, solution_steps
 
 def vigenere_encrypt(message, key):
-    result, _ = vigenere_encrypt_with_solution(message, key)
-    return result
+    return vigenere_translate(message, key, 'e')
 
 def vigenere_decrypt(cipher, key):
-    result, _ = vigenere_decrypt_with_solution(cipher, key)
-    return result
+    return vigenere_translate(cipher, key, 'd')
 
 
 if __name__ == "__main__":
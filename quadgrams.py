@@ -0,0 +1,93 @@
+import math
+import os
+import sys
+from array import array
+from cipher_engine import HAVE_NUMPY, LETTER_TO_INDEX, letter_indices, np
+
+# Log10 probability of every quadgram aaaa..zzzz as little-endian float32, 26^4 entries
+QUADGRAM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'quadgrams.bin')
+TABLE_SIZE = 26 ** 4
+
+_table = None
+
+def load_table(path=QUADGRAM_PATH):
+    """Return the quadgram table, memory-mapped on first use (a flat array('f') without NumPy)"""
+    global _table
+    if _table is None:
+        if HAVE_NUMPY:
+            _table = np.memmap(path, dtype='<f4', mode='r', shape=(TABLE_SIZE,))
+        else:
+            _table = array('f')
+            with open(path, 'rb') as f:
+                _table.fromfile(f, TABLE_SIZE)
+            if sys.byteorder == 'big':
+                _table.byteswap()
+    return _table
+
+def table_available(path=QUADGRAM_PATH):
+    """Whether the quadgram table is loaded or a readable table of the right size exists"""
+    if _table is not None:
+        return True
+    try:
+        return os.path.getsize(path) == TABLE_SIZE * 4 and os.access(path, os.R_OK)
+    except OSError:
+        return False
+
+def build_table(corpus_paths, output_path=QUADGRAM_PATH):
+    """Count the quadgrams of some English text files and write the binary table.
+
+    Letters are counted across word boundaries; unseen quadgrams get a floor of
+    log10(0.01 / total). Returns the number of quadgrams counted.
+    """
+    counts = [0] * TABLE_SIZE
+    for path in corpus_paths:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            letters = [LETTER_TO_INDEX[c] for c in f.read().lower() if c in LETTER_TO_INDEX]
+        for i in range(len(letters) - 3):
+            counts[((letters[i] * 26 + letters[i + 1]) * 26 + letters[i + 2]) * 26 + letters[i + 3]] += 1
+    total = sum(counts)
+    if total == 0:
+        raise ValueError("Corpus contains no quadgrams")
+    floor = math.log10(0.01 / total)
+    table = array('f', (math.log10(count / total) if count else floor for count in counts))
+    if sys.byteorder == 'big':
+        table.byteswap()
+    with open(output_path, 'wb') as f:
+        table.tofile(f)
+    return total
+
+def quadgram_indices(letters):
+    """Table index of every quadgram along the last axis of a 0-25 letter array"""
+    letters = np.asarray(letters, dtype=np.int64)
+    return ((letters[..., :-3] * 26 + letters[..., 1:-2]) * 26 + letters[..., 2:-1]) * 26 + letters[..., 3:]
+
+def score_letters(letters):
+    """Total log10 probability of a 0-25 letter array; a 2-D array gives one score per row"""
+    table = load_table()
+    if HAVE_NUMPY:
+        return table[quadgram_indices(letters)].sum(axis=-1, dtype=np.float64)
+    return sum(table[((letters[i] * 26 + letters[i + 1]) * 26 + letters[i + 2]) * 26 + letters[i + 3]]
+               for i in range(len(letters) - 3))
+
+def _letters(text):
+    if HAVE_NUMPY:
+        return letter_indices(text)
+    return [LETTER_TO_INDEX[c] for c in text.lower() if c in LETTER_TO_INDEX]
+
+def quadgram_score(text):
+    """Total log10 probability of the letters of a text under the quadgram model (higher is more English)"""
+    return float(score_letters(_letters(text)))
+
+def quadgram_fitness(text):
+    """Mean log10 probability per quadgram, comparable between texts of any length (0.0 if there are none)"""
+    letters = _letters(text)
+    if len(letters) < 4:
+        return 0.0
+    return float(score_letters(letters)) / (len(letters) - 3)
+
+if __name__ == '__main__':
+    # python quadgrams.py <corpus.txt> [<corpus.txt> ...]
+    if len(sys.argv) < 2:
+        print("Usage: python quadgrams.py <corpus.txt> [<corpus.txt> ...]")
+        sys.exit(1)
+    print(f"Counted {build_table(sys.argv[1:])} quadgrams -> {QUADGRAM_PATH}")
@@ -0,0 +1,40 @@
+import pytest
+from cipher_engine import additive_translate, autokey_encrypt_fast, vigenere_translate
+from history_analysis import analyze_entry, classify_ciphertext
+
+# Game-length phrases (18-38 letters), too short for absolute fitness thresholds
+PHRASES = [
+    "CIPHER WORLD IS A FUN GAME TO PLAY WITH FRIENDS",
+    "MASTER THE CIPHER TECHNIQUES",
+    "ADVANCED CRYPTOGRAPHIC METHODS",
+    "COMPLEX CIPHER CHALLENGES",
+    "PROFESSIONAL ENCRYPTION ALGORITHMS",
+    "SOPHISTICATED DECRYPTION PROCEDURES",
+    "ULTIMATE CRYPTANALYSIS EXPERTISE",
+    "ENCRYPTION GAME RULES",
+    "SECRET MESSAGE HIDDEN",
+]
+
+ENCRYPTIONS = [
+    ('additive', lambda text, key: additive_translate(text, 'e', key), (3, 10, 19)),
+    ('autokey', autokey_encrypt_fast, ('c', 'k', 't')),
+    ('vigenere', lambda text, key: vigenere_translate(text, key, 'e'), ('lemon', 'key', 'secret')),
+]
+
+@pytest.mark.parametrize('phrase', PHRASES)
+@pytest.mark.parametrize('cipher, encrypt, keys', ENCRYPTIONS, ids=[e[0] for e in ENCRYPTIONS])
+def test_classify_game_phrases(phrase, cipher, encrypt, keys):
+    for key in keys:
+        assert classify_ciphertext(encrypt(phrase, key)) == cipher
+
+def test_analyze_entry_recovers_additive_key():
+    plaintext = "cipher world is a fun game to play with friends"
+    report = analyze_entry({
+        'cipher_type': 'Additive Cipher',
+        'operation': 'Encryption',
+        'plaintext': plaintext,
+        'key': '10',
+        'result': additive_translate(plaintext, 'e', 10),
+    })
+    assert report['detected_type'] == 'additive'
+    assert report['match']
@@ -0,0 +1,146 @@
+import gzip
+import json
+import os
+import re
+import sys
+from collections import Counter
+from cipher_engine import LETTER_TO_INDEX, additive_translate
+
+# Shift-normalized word forms: every word is shifted so it starts with 'a', so all
+# 26 additive encryptions of a word share one form. Gzipped lines of
+# "form word word ...", words ordered from most to least common. The shipped index
+# holds the 40,000 commonest words of the English word-frequency list distributed
+# with pyspellchecker (MIT, counted from OpenSubtitles; notice in assets/word_index.LICENSE):
+#     python word_index.py --frequencies --top 40000 en.json.gz
+WORD_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'word_index.txt.gz')
+
+_WORD = re.compile(r'[a-z]+')
+_VOWEL = re.compile(r'[aeiouy]')
+_TRIPLE = re.compile(r'(.)\1\1')
+MAX_WORD_LENGTH = 20
+_index = None
+
+def normalize(word):
+    """Return (form, shift) where form is the word shifted to start with 'a'"""
+    word = word.lower()
+    shift = LETTER_TO_INDEX[word[0]]
+    return additive_translate(word, 'd', shift), shift
+
+def looks_like_word(word):
+    """False for tokens that are not words: no vowel, a letter three times running, stray single letters"""
+    if not _WORD.fullmatch(word) or len(word) > MAX_WORD_LENGTH:
+        return False
+    if len(word) == 1:
+        return word in ('a', 'i')
+    return bool(_VOWEL.search(word)) and not _TRIPLE.search(word)
+
+def _write_index(words, output_path):
+    """Write words (commonest first) grouped by form, skipping non-words; returns the number written"""
+    forms = {}
+    for word in words:
+        if looks_like_word(word):
+            forms.setdefault(normalize(word)[0], []).append(word)
+    with gzip.open(output_path, 'wt', encoding='ascii') as f:
+        for form in sorted(forms):
+            f.write(form + ' ' + ' '.join(forms[form]) + '\n')
+    return sum(len(words) for words in forms.values())
+
+def build_index(corpus_paths, output_path=WORD_INDEX_PATH, min_count=2):
+    """Collect the words seen at least min_count times in some text files and write the index.
+
+    Returns the number of words indexed.
+    """
+    counts = Counter()
+    for path in corpus_paths:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            counts.update(_WORD.findall(f.read().lower()))
+    return _write_index([word for word, count in counts.most_common() if count >= min_count], output_path)
+
+def read_frequencies(path):
+    """Word counts from a frequency list: "word count" lines or a JSON object, optionally gzipped"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        if path.endswith(('.json', '.json.gz')):
+            return Counter(json.load(f))
+        counts = Counter()
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                counts[parts[0]] += int(parts[1])
+        return counts
+
+def build_index_from_frequencies(paths, output_path=WORD_INDEX_PATH, top=40000):
+    """Index the top most common words of some English word-frequency lists.
+
+    Returns the number of words indexed.
+    """
+    counts = Counter()
+    for path in paths:
+        counts.update(read_frequencies(path))
+    words = [word for word, _ in counts.most_common() if looks_like_word(word.lower())]
+    return _write_index([word.lower() for word in words[:top]], output_path)
+
+def load_index(path=WORD_INDEX_PATH):
+    """Return the form -> words dictionary, read from disk on first use"""
+    global _index
+    if _index is None:
+        index = {}
+        with gzip.open(path, 'rt', encoding='ascii') as f:
+            for line in f:
+                form, *words = line.split()
+                index[form] = words
+        _index = index
+    return _index
+
+def word_candidates(cipher_word):
+    """Every dictionary word an additive cipher word could be, as (word, key) pairs, commonest first"""
+    if not cipher_word.isalpha() or not cipher_word.isascii():
+        return []
+    form, cipher_shift = normalize(cipher_word)
+    return [(word, (cipher_shift - normalize(word)[1]) % 26) for word in load_index().get(form, [])]
+
+def is_word(word):
+    """True if a lowercase word is in the dictionary"""
+    return word in load_index().get(normalize(word)[0], ())
+
+def suggest_keys(ciphertext, top=3):
+    """Rank additive keys by how many words of a ciphertext they turn into dictionary words.
+
+    Every cipher word votes for the keys of its candidates, longer words counting
+    for more. Returns (key, words_matched, plaintext) tuples for the best keys.
+    """
+    votes = Counter()
+    for cipher_word in _WORD.findall(ciphertext.lower()):
+        for key in {key for _, key in word_candidates(cipher_word)}:
+            votes[key] += len(cipher_word)
+    results = []
+    for key, _ in votes.most_common(top):
+        plaintext = additive_translate(ciphertext, 'd', key)
+        results.append((key, sum(1 for word in _WORD.findall(plaintext) if is_word(word)), plaintext))
+    return sorted(results, key=lambda result: -result[1])
+
+if __name__ == '__main__':
+    # python word_index.py [--min-count <n>] <corpus.txt> [<corpus.txt> ...]
+    # python word_index.py --frequencies [--top <n>] <list> [<list> ...]
+    args = sys.argv[1:]
+    min_count = 2
+    top = 40000
+    frequencies = args[:1] == ['--frequencies']
+    if frequencies:
+        args = args[1:]
+        if args[:1] == ['--top'] and len(args) > 1:
+            top = int(args[1])
+            args = args[2:]
+    elif args[:1] == ['--min-count'] and len(args) > 1:
+        min_count = int(args[1])
+        args = args[2:]
+    if not args:
+        print("Usage: python word_index.py [--min-count <n>] <corpus.txt> [<corpus.txt> ...]")
+        print("       python word_index.py --frequencies [--top <n>] <list> [<list> ...]")
+        print("       (frequency lists are \"word count\" lines or a JSON object, optionally gzipped)")
+        sys.exit(1)
+    if frequencies:
+        count = build_index_from_frequencies(args, top=top)
+    else:
+        count = build_index(args, min_count=min_count)
+    print(f"Indexed {count} words -> {WORD_INDEX_PATH}")